@@ -19,45 +19,17 @@ from .charts import (
     COMPOUND_COLORS,
 )
 from ..ml.feature_engineering import get_stint_summary
-
-# F1 TV broadcast style colors (matching arcade_replay.py)
-F1_RED = (225, 6, 0)
-F1_BLACK = (21, 21, 30)
-F1_DARK_GRAY = (38, 38, 48)
-F1_GRAY = (68, 68, 78)
-F1_WHITE = (255, 255, 255)
-F1_LIGHT_GRAY = (180, 180, 185)
-FASTEST_PURPLE = (170, 0, 255)
-
-PANEL_BG = (28, 28, 38, 240)
-PANEL_BG_ALT = (38, 38, 50, 240)
-
-
-def draw_rounded_rectangle(x, y, width, height, color, radius=10):
-    """Draw a filled rectangle with rounded corners."""
-    radius = max(0, min(radius, width / 2, height / 2))
-    if radius <= 0:
-        arcade.draw_lrbt_rectangle_filled(x, x + width, y, y + height, color)
-        return
-    arcade.draw_lrbt_rectangle_filled(
-        x + radius, x + width - radius, y, y + height, color
-    )
-    arcade.draw_lrbt_rectangle_filled(
-        x, x + width, y + radius, y + height - radius, color
-    )
-    arcade.draw_circle_filled(x + radius, y + radius, radius, color)
-    arcade.draw_circle_filled(x + width - radius, y + radius, radius, color)
-    arcade.draw_circle_filled(x + radius, y + height - radius, radius, color)
-    arcade.draw_circle_filled(x + width - radius, y + height - radius, radius, color)
-
-
-def draw_f1_panel(x, y, width, height, radius=4, show_red_accent=True):
-    """Draw an F1 broadcast style panel with optional red accent line."""
-    draw_rounded_rectangle(x, y, width, height, PANEL_BG, radius)
-    if show_red_accent:
-        arcade.draw_lrbt_rectangle_filled(
-            x, x + width, y + height - 3, y + height, F1_RED
-        )
+from ..ui_shapes import (
+    F1_BLACK,
+    F1_DARK_GRAY,
+    F1_GRAY,
+    F1_LIGHT_GRAY,
+    F1_RED,
+    F1_WHITE,
+    FASTEST_PURPLE,
+    create_f1_panel,
+    create_rounded_rectangle,
+)
 
 
 class Button:
@@ -98,6 +70,8 @@ class Button:
             anchor_y="center",
             bold=selected,
         )
+        # Background shape list per fill color (normal/hover/selected)
+        self._shapes = {}
 
     def contains(self, px: float, py: float) -> bool:
         """Check if point is inside button."""
@@ -115,7 +89,15 @@ class Button:
         else:
             color = self.color_normal
 
-        draw_rounded_rectangle(self.x, self.y, self.width, self.height, color, radius=4)
+        shapes = self._shapes.get(color)
+        if shapes is None:
+            shapes = arcade.shape_list.ShapeElementList()
+            for shape in create_rounded_rectangle(
+                self.x, self.y, self.width, self.height, color, radius=4
+            ):
+                shapes.append(shape)
+            self._shapes[color] = shapes
+        shapes.draw()
 
         # Text (using pre-created Text object)
         self._text_obj.x = self.x + self.width / 2
@@ -169,6 +151,9 @@ class TyreAnalysisWindow(arcade.Window):
         self.heatmap_texture = None
         self.model_stats_texture = None
 
+        # Panel backgrounds, one shape list per geometry (see _draw_panel)
+        self._panel_shapes = {}
+
         # UI buttons
         self.driver_buttons: List[Button] = []
         self.stint_buttons: List[Button] = []
@@ -426,6 +411,7 @@ class TyreAnalysisWindow(arcade.Window):
     def on_resize(self, width: int, height: int):
         """Handle window resize."""
         super().on_resize(width, height)
+        self._panel_shapes.clear()
         self._build_ui()
 
     def on_draw(self):
@@ -451,10 +437,24 @@ class TyreAnalysisWindow(arcade.Window):
         for btn in self.nav_buttons:
             btn.draw()
 
+    def _draw_panel(self, x, y, width, height, radius=4, show_red_accent=True):
+        """
+        Draw an F1 broadcast style panel. Each geometry is built into a shape
+        list once and reused (the cache is cleared on resize).
+        """
+        key = (x, y, width, height, radius, show_red_accent)
+        shapes = self._panel_shapes.get(key)
+        if shapes is None:
+            shapes = arcade.shape_list.ShapeElementList()
+            for shape in create_f1_panel(x, y, width, height, radius, show_red_accent):
+                shapes.append(shape)
+            self._panel_shapes[key] = shapes
+        shapes.draw()
+
     def _draw_header(self):
         """Draw header panel with session info."""
         header_height = 50
-        draw_f1_panel(0, self.height - header_height, self.width, header_height, radius=0)
+        self._draw_panel(0, self.height - header_height, self.width, header_height, radius=0)
 
         # Title (using pre-created Text object)
         self.header_title_text.x = self.width / 2
@@ -475,7 +475,7 @@ class TyreAnalysisWindow(arcade.Window):
         sidebar_y = 80
         sidebar_height = self.height - 150
 
-        draw_f1_panel(sidebar_x, sidebar_y, sidebar_width, sidebar_height, show_red_accent=False)
+        self._draw_panel(sidebar_x, sidebar_y, sidebar_width, sidebar_height, show_red_accent=False)
 
         # "DRIVER" label (using pre-created Text object)
         label_y = self.height - 120
@@ -506,7 +506,7 @@ class TyreAnalysisWindow(arcade.Window):
         chart_height = 420
 
         # Degradation chart panel
-        draw_f1_panel(chart_x, chart_y, chart_width, chart_height)
+        self._draw_panel(chart_x, chart_y, chart_width, chart_height)
 
         # Draw degradation chart texture
         if self.deg_chart_texture:
@@ -526,7 +526,7 @@ class TyreAnalysisWindow(arcade.Window):
         # Compound comparison panel
         comp_y = 80
         comp_height = 220
-        draw_f1_panel(chart_x, comp_y, chart_width, comp_height)
+        self._draw_panel(chart_x, comp_y, chart_width, comp_height)
 
         # Draw comparison chart texture
         if self.comparison_texture:
@@ -549,7 +549,7 @@ class TyreAnalysisWindow(arcade.Window):
         panel_width = 220
         panel_height = 260
 
-        draw_f1_panel(panel_x, panel_y, panel_width, panel_height)
+        self._draw_panel(panel_x, panel_y, panel_width, panel_height)
 
         # Title (using pre-created Text object)
         self.stint_summary_title_text.x = panel_x + panel_width / 2
@@ -573,7 +573,7 @@ class TyreAnalysisWindow(arcade.Window):
         # Model stats panel below
         stats_y = 320
         stats_height = 140
-        draw_f1_panel(panel_x, stats_y, panel_width, stats_height)
+        self._draw_panel(panel_x, stats_y, panel_width, stats_height)
 
         # Title (using pre-created Text object)
         self.model_stats_title_text.x = panel_x + panel_width / 2
@@ -601,7 +601,7 @@ class TyreAnalysisWindow(arcade.Window):
         panel_width = 410
         panel_height = 220
 
-        draw_f1_panel(panel_x, panel_y, panel_width, panel_height)
+        self._draw_panel(panel_x, panel_y, panel_width, panel_height)
 
         # Title (using pre-created Text object)
         self.prediction_title_text.x = panel_x + 15
@@ -1,18 +1,26 @@
+import math
 import os
 import arcade
-from src.track import world_to_screen
+import numpy as np
+import pyglet
+from src.frames import build_frame_arrays, interval_gaps
+from src.track import build_world_to_screen_transform, compute_bounds
+from src.tyres import COMPOUND_KEYS
+from src.ui_shapes import (
+    F1_BLACK,
+    F1_DARK_GRAY,
+    F1_GRAY,
+    F1_LIGHT_GRAY,
+    F1_RED,
+    F1_WHITE,
+    FASTEST_PURPLE,
+    create_f1_panel,
+    create_rounded_rectangle,
+)
 
 # ================================
 # F1 TV BROADCAST STYLE PALETTE
 # ================================
-# Official F1 colors
-F1_RED = (225, 6, 0)  # Official F1 red
-F1_BLACK = (21, 21, 30)  # Near-black background
-F1_DARK_GRAY = (38, 38, 48)  # Panel backgrounds
-F1_GRAY = (68, 68, 78)  # Secondary elements
-F1_WHITE = (255, 255, 255)  # Primary text
-F1_LIGHT_GRAY = (180, 180, 185)  # Secondary text
-
 # Position colors (podium)
 P1_GOLD = (255, 215, 0)
 P2_SILVER = (192, 192, 200)
@@ -20,126 +28,40 @@ P3_BRONZE = (205, 127, 50)
 
 # Status colors
 DRS_GREEN = (0, 210, 80)
-FASTEST_PURPLE = (170, 0, 255)
 INTERVAL_YELLOW = (255, 210, 0)
 
-# Panel colors
-PANEL_BG = (28, 28, 38, 240)
-PANEL_BG_ALT = (38, 38, 50, 240)
-
-
-def draw_rounded_rectangle(x, y, width, height, color, radius=10):
-    """Draw a filled rectangle with rounded corners."""
-    radius = max(0, min(radius, width / 2, height / 2))
-    if radius <= 0:
-        arcade.draw_lrbt_rectangle_filled(x, x + width, y, y + height, color)
-        return
-    # Draw main body rectangles
-    arcade.draw_lrbt_rectangle_filled(
-        x + radius, x + width - radius, y, y + height, color
-    )
-    arcade.draw_lrbt_rectangle_filled(
-        x, x + width, y + radius, y + height - radius, color
-    )
-    # Draw corner circles
-    arcade.draw_circle_filled(x + radius, y + radius, radius, color)
-    arcade.draw_circle_filled(x + width - radius, y + radius, radius, color)
-    arcade.draw_circle_filled(x + radius, y + height - radius, radius, color)
-    arcade.draw_circle_filled(x + width - radius, y + height - radius, radius, color)
-
-
-def draw_rounded_rectangle_outline(x, y, width, height, color, radius=10, line_width=1):
-    """Draw a rectangle outline with rounded corners."""
-    radius = max(0, min(radius, width / 2, height / 2))
-    if radius <= 0:
-        arcade.draw_lrbt_rectangle_outline(
-            x, x + width, y, y + height, color, line_width
-        )
+# Leaderboard row colors: alternating backgrounds and highlight tints
+ROW_BG_EVEN = (35, 35, 45, 200)
+ROW_BG_ODD = (28, 28, 38, 200)
+ROW_HOVER_TINT = (255, 255, 255, 25)
+ROW_SELECTED_TINT = (*F1_RED[:3], 50)  # Red tint like F1 TV
+
+# Track polyline layers, bottom to top: (color, line width)
+TRACK_LAYERS = (
+    ((30, 30, 35), 12),  # Track shadow/outline
+    ((55, 55, 60), 8),  # Main track surface
+    ((100, 100, 105), 3),  # Racing line
+    ((140, 140, 145), 1),  # Center line
+)
+
+
+def _place_icon(sprite, texture, x, y, size):
+    """Show a square icon sprite at (x, y), or hide it if there's no texture."""
+    if texture is None:
+        sprite.visible = False
         return
-    # Draw straight lines
-    arcade.draw_line(x + radius, y, x + width - radius, y, color, line_width)  # Bottom
-    arcade.draw_line(
-        x + radius, y + height, x + width - radius, y + height, color, line_width
-    )  # Top
-    arcade.draw_line(x, y + radius, x, y + height - radius, color, line_width)  # Left
-    arcade.draw_line(
-        x + width, y + radius, x + width, y + height - radius, color, line_width
-    )  # Right
-    # Draw corner arcs
-    arcade.draw_arc_outline(
-        x + radius, y + radius, radius * 2, radius * 2, color, 180, 270, line_width
-    )
-    arcade.draw_arc_outline(
-        x + width - radius,
-        y + radius,
-        radius * 2,
-        radius * 2,
-        color,
-        270,
-        360,
-        line_width,
-    )
-    arcade.draw_arc_outline(
-        x + radius,
-        y + height - radius,
-        radius * 2,
-        radius * 2,
-        color,
-        90,
-        180,
-        line_width,
-    )
-    arcade.draw_arc_outline(
-        x + width - radius,
-        y + height - radius,
-        radius * 2,
-        radius * 2,
-        color,
-        0,
-        90,
-        line_width,
-    )
-
-
-def draw_f1_panel(x, y, width, height, radius=4, show_red_accent=True):
-    """Draw an F1 broadcast style panel with optional red accent line."""
-    # Main panel background
-    draw_rounded_rectangle(x, y, width, height, PANEL_BG, radius)
-    # Red accent line on top (F1 signature style)
-    if show_red_accent:
-        arcade.draw_lrbt_rectangle_filled(
-            x, x + width, y + height - 3, y + height, F1_RED
-        )
+    sprite.texture = texture
+    sprite.size = (size, size)
+    sprite.position = (x, y)
+    sprite.visible = True
 
 
-def _compound_key(compound: str | None) -> str:
-    """
-    Normalize FastF1 compound strings to our tyre texture keys.
-    """
-    if not compound:
-        return "unknown"
-    c = compound.strip().upper()
-    if c.startswith("SOFT"):
-        return "soft"
-    if c.startswith("MED"):
-        return "medium"
-    if c.startswith("HARD"):
-        return "hard"
-    if c.startswith("INTER"):
-        return "intermediate"
-    if c.startswith("WET"):
-        return "wet"
-    return "unknown"
-
-
-def _drs_is_active(drs_val: int) -> bool:
+def _drs_is_active(drs_val):
     """
     FastF1 DRS values often use >=10 to mean open/active (common convention in telemetry streams).
+    Works elementwise on the integer DRS arrays from build_frame_arrays.
     """
-    try:
-        return int(drs_val) >= 10
-    except Exception:
-        return False
+    return drs_val >= 10
 
 
 class F1ReplayWindow(arcade.Window):
@@ -164,13 +86,54 @@ class F1ReplayWindow(arcade.Window):
 
         self.frames = frames
         self.n_frames = len(frames)
+        self._last_frame = self.n_frames - 1  # Playback/seek clamp
+
+        # Columnar per-frame driver state: self.F[field][frame_idx, driver_col]
+        self.driver_codes, self.F = build_frame_arrays(frames)
+        self.n_drivers = len(self.driver_codes)
+        # Driver columns sorted by race position, per frame (leader first)
+        self.frame_order = np.argsort(self.F["pos"], axis=1, kind="stable").astype(
+            np.int8
+        )
+        # Inverse permutation: place in frame_order of each driver column
+        self.frame_rank = np.argsort(self.frame_order, axis=1).astype(np.int8)
+        # Interval gaps (s) between consecutive places, for every frame at once
+        self.frame_gaps = interval_gaps(
+            np.take_along_axis(self.F["progress"], self.frame_order, axis=1),
+            np.take_along_axis(self.F["speed"], self.frame_order, axis=1),
+        )
+        # Per-frame HUD laps: the leader's lap and the highest lap on track
+        if self.n_drivers:
+            laps = self.F["lap"]
+            self.leader_lap_per_frame = laps[
+                np.arange(self.n_frames), self.frame_order[:, 0]
+            ]
+            self.max_lap_per_frame = laps.max(axis=1)
+        else:
+            self.leader_lap_per_frame = np.ones(self.n_frames, dtype=np.int16)
+            self.max_lap_per_frame = self.leader_lap_per_frame
+        # DRS open flag per frame and driver column
+        self.drs_active = _drs_is_active(self.F["drs"])
+        self.driver_col = {drv: j for j, drv in enumerate(self.driver_codes)}
+
+        # Screen-space car positions, refilled every frame
+        self._car_sx = np.empty(self.n_drivers, dtype=np.float32)
+        self._car_sy = np.empty(self.n_drivers, dtype=np.float32)
 
         self.track_x, self.track_y = track_xy
+        # Padded world bounds of the track; fixed for the session, so only the
+        # transform is rebuilt on resize
+        self._track_bounds = compute_bounds(self.track_x, self.track_y, pad=50.0)
 
         # Avoid "self.scale" name collision with Arcade Window properties
         self.world_scale, self.world_tx, self.world_ty = transform
 
         self.driver_colors = driver_colors or {}
+        # Team colors indexed by driver column (same order as driver_codes)
+        self.driver_color_by_col = [
+            self.driver_colors.get(drv, arcade.color.WHITE)
+            for drv in self.driver_codes
+        ]
         self.fps = fps
         self.race_info = race_info or "Unknown Race"
         self.session_info = session_info or "Unknown Session"
@@ -183,8 +146,34 @@ class F1ReplayWindow(arcade.Window):
         self.paused = False
         self.speed_choices = [0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0]
         self.speed_i = 1
+        self._cur_speed = self.speed_choices[self.speed_i]
+        # LEFT/RIGHT seek (5 seconds of frames), whole frames
+        self._seek_step = int(round(self.fps * 5))
         self.show_ui = True  # Toggle for showing/hiding UI panels
         self.show_progress_bar = True  # Toggle for progress bar
+        # Keyboard controls (see on_key_press)
+        key = arcade.key
+        self._key_handlers = {
+            key.SPACE: self._toggle_pause,
+            key.R: self._restart,
+            key.H: self._toggle_ui,
+            key.P: self._toggle_progress_bar,
+            key.L: self._toggle_leaderboard,
+            key.UP: self._speed_up,
+            key.DOWN: self._speed_down,
+            key.RIGHT: self._seek_forward,
+            key.LEFT: self._seek_back,
+            key.F: self._toggle_fullscreen,
+            key.F11: self._toggle_fullscreen,
+        }
+        self._last_hud_state = None  # (lap, total, secs, speed) last shown in HUD
+        # Frame-derived view (see _update_frame_view): integer frame it was
+        # built for, plus a flag for changes other than the playhead (resize)
+        self._fi = None
+        self._dirty = True
+        self._order = self.frame_order[0] if self.n_frames else self.frame_order
+        # Window size the layout was last built for (see on_resize)
+        self._last_resize_size = None
 
         # Track fastest lap driver
         self.fastest_lap_driver = None
@@ -198,13 +187,16 @@ class F1ReplayWindow(arcade.Window):
 
         arcade.set_background_color(F1_BLACK)
 
-        # Precompute track polyline in screen coords (performance)
-        self.track_pts_screen = []
-        for x, y in zip(self.track_x, self.track_y):
-            sx, sy = world_to_screen(
-                float(x), float(y), self.world_scale, self.world_tx, self.world_ty
-            )
-            self.track_pts_screen.append((sx, sy))
+        # Precompute track polyline in screen coords
+        self._update_track_screen_points()
+
+        # Pop-up panel backgrounds by geometry (see _draw_overlay_panel)
+        self._overlay_shapes = {}
+
+        # Shared text batches: each renders all of its labels in one draw call.
+        # HUD text is always visible, UI text only while the UI panels are shown.
+        self.hud_text_batch = pyglet.graphics.Batch()
+        self.ui_text_batch = pyglet.graphics.Batch()
 
         # HUD text - Grand Prix / Session info (top center)
         self.gp_title_text = arcade.Text(
@@ -216,6 +208,7 @@ class F1ReplayWindow(arcade.Window):
             bold=True,
             anchor_x="center",
             anchor_y="top",
+            batch=self.hud_text_batch,
         )
         self.session_text = arcade.Text(
             self.session_info,
@@ -226,11 +219,22 @@ class F1ReplayWindow(arcade.Window):
             bold=True,
             anchor_x="center",
             anchor_y="top",
+            batch=self.hud_text_batch,
         )
 
         # Lap and Race time (top left)
-        self.lap_text = arcade.Text("", 20, self.height - 25, F1_WHITE, 16, bold=True)
-        self.race_time_text = arcade.Text("", 20, self.height - 48, F1_LIGHT_GRAY, 13)
+        self.lap_text = arcade.Text(
+            "",
+            20,
+            self.height - 25,
+            F1_WHITE,
+            16,
+            bold=True,
+            batch=self.hud_text_batch,
+        )
+        self.race_time_text = arcade.Text(
+            "", 20, self.height - 48, F1_LIGHT_GRAY, 13, batch=self.hud_text_batch
+        )
 
         # Controls text (bottom left, multi-line)
         self.controls_text = arcade.Text(
@@ -241,12 +245,14 @@ class F1ReplayWindow(arcade.Window):
             11,
             multiline=True,
             width=200,
+            batch=self.ui_text_batch,
         )
 
         # ---------------------------
         # Leaderboard layout (right side)
         # ---------------------------
         self.lb_w = 300
+        self.lb_w_collapsed = 115  # Just position and driver name
         self.lb_h = self.height - 120
         self.lb_x = self.width - self.lb_w - 20
         self.lb_y = 50
@@ -259,6 +265,10 @@ class F1ReplayWindow(arcade.Window):
         self.hover_index = None
         self.selected_driver = None
 
+        # Row hit-test bounds (rows are a uniform grid, see _leaderboard_row_at)
+        self._lb_n_rows = min(len(frames[0]["drivers"]), 20) if frames else 0
+        self._update_leaderboard_bounds()
+
         self.lb_title = arcade.Text(
             "LEADERBOARD",
             self.lb_x + self.lb_padding,
@@ -268,6 +278,7 @@ class F1ReplayWindow(arcade.Window):
             bold=True,
             anchor_x="left",
             anchor_y="top",
+            batch=self.ui_text_batch,
         )
 
         # We'll reuse these text objects (positions updated each draw)
@@ -280,9 +291,12 @@ class F1ReplayWindow(arcade.Window):
                 14,
                 anchor_x="left",
                 anchor_y="top",
+                batch=self.ui_text_batch,
             )
             for _ in range(20)
         ]
+        # Last (text, color) pushed to each row, so unchanged rows are skipped
+        self._lb_row_cache = [None] * 20
 
         # ---------------------------
         # Tyre textures (images/tyres)
@@ -305,6 +319,12 @@ class F1ReplayWindow(arcade.Window):
             if os.path.exists(path):
                 self.tyre_textures[key] = arcade.load_texture(path)
 
+        # Indexed by compound code (see src.tyres.COMPOUND_KEYS)
+        self.tyre_texture_by_code = [
+            self.tyre_textures.get(key) or self.tyre_textures.get("unknown")
+            for key in COMPOUND_KEYS
+        ]
+
         self.tyre_icon_size = 16  # px
 
         # ---------------------------
@@ -317,6 +337,21 @@ class F1ReplayWindow(arcade.Window):
         self.pixel_car_size = 40  # px height for progress bar
         self.pixel_car_size_small = 24  # px height for telemetry header
 
+        # Progress bar as one SpriteList, bottom to top: background, fill,
+        # border edges, pixel car playhead (laid out in _rebuild_panel_shapes)
+        self._progress_bg = arcade.SpriteSolidColor(4, 4, color=F1_DARK_GRAY)
+        self._progress_fill = arcade.SpriteSolidColor(4, 4, color=F1_RED)
+        self._progress_edges = [
+            arcade.SpriteSolidColor(4, 4, color=F1_GRAY) for _ in range(4)
+        ]
+        self._progress_car = None
+        self.progress_sprites = arcade.SpriteList()
+        for sprite in (self._progress_bg, self._progress_fill, *self._progress_edges):
+            self.progress_sprites.append(sprite)
+        if self.pixel_car_texture is not None:
+            self._progress_car = arcade.Sprite(self.pixel_car_texture)
+            self.progress_sprites.append(self._progress_car)
+
         # ---------------------------
         # Compact Weather box (top left, below lap info)
         # ---------------------------
@@ -335,6 +370,7 @@ class F1ReplayWindow(arcade.Window):
             bold=True,
             anchor_x="left",
             anchor_y="top",
+            batch=self.ui_text_batch,
         )
         self.weather_lines = [
             arcade.Text(
@@ -345,9 +381,12 @@ class F1ReplayWindow(arcade.Window):
                 10,
                 anchor_x="left",
                 anchor_y="top",
+                batch=self.ui_text_batch,
             )
             for i in range(5)
         ]
+        # Raw weather values last formatted into weather_lines
+        self._weather_cache = None
 
         # ---------------------------
         # Driver telemetry box (left side, below weather)
@@ -359,6 +398,7 @@ class F1ReplayWindow(arcade.Window):
         self.max_driver_boxes = 1  # Show only selected driver
 
         # Create text objects for each driver box
+        batch = self.ui_text_batch
         self.driver_boxes = []
         for i in range(self.max_driver_boxes):
             box = {
@@ -371,6 +411,7 @@ class F1ReplayWindow(arcade.Window):
                     bold=True,
                     anchor_x="left",
                     anchor_y="top",
+                    batch=batch,
                 ),
                 "lines": [
                     arcade.Text(
@@ -381,35 +422,93 @@ class F1ReplayWindow(arcade.Window):
                         13,
                         anchor_x="left",
                         anchor_y="top",
+                        batch=batch,
                     )
                     for _ in range(5)
                 ],
                 "throttle_pct": arcade.Text(
-                    "", 0, 0, DRS_GREEN, 9, bold=True, anchor_x="center"
+                    "", 0, 0, DRS_GREEN, 9, bold=True, anchor_x="center", batch=batch
                 ),
                 "brake_pct": arcade.Text(
-                    "", 0, 0, F1_RED, 9, bold=True, anchor_x="center"
+                    "", 0, 0, F1_RED, 9, bold=True, anchor_x="center", batch=batch
                 ),
                 # Sector times section
-                "sector_title": arcade.Text("SECTORS", 0, 0, F1_WHITE, 11, bold=True),
+                "sector_title": arcade.Text(
+                    "SECTORS", 0, 0, F1_WHITE, 11, bold=True, batch=batch
+                ),
                 "sector_labels": [
-                    arcade.Text("S1:", 0, 0, F1_LIGHT_GRAY, 12) for _ in range(3)
+                    arcade.Text("S1:", 0, 0, F1_LIGHT_GRAY, 12, batch=batch)
+                    for _ in range(3)
                 ],
                 "sector_values": [
-                    arcade.Text("", 0, 0, F1_WHITE, 12, bold=True, anchor_x="right")
+                    arcade.Text(
+                        "",
+                        0,
+                        0,
+                        F1_WHITE,
+                        12,
+                        bold=True,
+                        anchor_x="right",
+                        batch=batch,
+                    )
                     for _ in range(3)
                 ],
                 # Tyre strategy section
-                "tyre_title": arcade.Text("TYRE", 0, 0, F1_WHITE, 11, bold=True),
+                "tyre_title": arcade.Text(
+                    "TYRE", 0, 0, F1_WHITE, 11, bold=True, batch=batch
+                ),
                 "tyre_lines": [
-                    arcade.Text("", 0, 0, F1_LIGHT_GRAY, 12) for _ in range(3)
+                    arcade.Text("", 0, 0, F1_LIGHT_GRAY, 12, batch=batch)
+                    for _ in range(3)
                 ],
             }
             # Set sector labels
             box["sector_labels"][0].text = "S1:"
             box["sector_labels"][1].text = "S2:"
             box["sector_labels"][2].text = "S3:"
+            # Flat list of every label, for toggling the box in the batch
+            box["all_texts"] = [
+                box["title"],
+                *box["lines"],
+                box["throttle_pct"],
+                box["brake_pct"],
+                box["sector_title"],
+                *box["sector_labels"],
+                *box["sector_values"],
+                box["tyre_title"],
+                *box["tyre_lines"],
+            ]
             self.driver_boxes.append(box)
+        self._driver_box_visible = True
+        # (frame, driver column, box x, box y) the box labels were last set for
+        self._driver_box_text_key = None
+        # Per-frame box graphics: team color accents and throttle/brake fills
+        # (laid out in _rebuild_panel_shapes)
+        self._driver_accent_top = arcade.SpriteSolidColor(4, 4, color=F1_WHITE)
+        self._driver_accent_left = arcade.SpriteSolidColor(4, 4, color=F1_WHITE)
+        self._throttle_fill = arcade.SpriteSolidColor(30, 4, color=DRS_GREEN)
+        self._brake_fill = arcade.SpriteSolidColor(30, 4, color=F1_RED)
+        self.driver_box_sprites = arcade.SpriteList()
+        for sprite in (
+            self._driver_accent_top,
+            self._driver_accent_left,
+            self._throttle_fill,
+            self._brake_fill,
+        ):
+            self.driver_box_sprites.append(sprite)
+
+        # Pre-formatted telemetry strings over their small integer domains,
+        # so the per-frame box update picks a string instead of building one
+        self._speed_str = tuple(f"Speed: {s} km/h" for s in range(401))
+        self._gear_drs_str = tuple(
+            tuple(f"Gear: {g}   DRS: {drs}" for g in range(10))
+            for drs in ("OFF", "ON")
+        )
+        # Known compounds only; code 0 is labelled from the frame's own
+        # compound string (see _update_driver_box_text)
+        self._compound_str = tuple(
+            f"Compound: {key[:3].upper()}" for key in COMPOUND_KEYS
+        )
 
         # Interval gap text objects (20 for leaderboard rows)
         self.gap_texts = [
@@ -420,9 +519,17 @@ class F1ReplayWindow(arcade.Window):
                 F1_LIGHT_GRAY,
                 12,
                 anchor_x="right",
+                batch=self.ui_text_batch,
             )
             for _ in range(20)
         ]
+        # Gap last shown on each row in tenths of a second (-1 = "LEADER")
+        self._gap_cache = [None] * 20
+        # Whether the gap/tyre/DRS columns may still be showing (cleared once
+        # on collapse)
+        self._lb_cols_shown = True
+        # Rows filled last frame; rows past the current count are blanked once
+        self._lb_prev_n = 20
 
         # Load weather icons for compact display
         weather_dir = os.path.join(base_dir, "images", "weather")
@@ -433,8 +540,52 @@ class F1ReplayWindow(arcade.Window):
                 self.weather_textures[name] = arcade.load_texture(path)
         self.weather_icon_size = 24
 
-        # Click rects for leaderboard rows (rebuilt each draw)
-        self._lb_rects = []
+        # Tyre icons and DRS dots (one each per leaderboard row) and the
+        # weather icon as sprites. Textures share arcade's default atlas, so
+        # one SpriteList draws every icon with a single draw call.
+        # Round markers all share one white circle texture, tinted and scaled
+        # per sprite (drawn larger than needed so downscaled edges stay smooth)
+        self.icon_sprites = arcade.SpriteList()
+        # Leaderboard row accents and hover/selection highlights go first, so
+        # they stay under the row icons (laid out in _rebuild_panel_shapes)
+        self.row_accent_sprites = [
+            arcade.SpriteSolidColor(4, 4, color=F1_WHITE) for _ in range(20)
+        ]
+        self.row_hover_sprite = arcade.SpriteSolidColor(4, 4, color=ROW_HOVER_TINT)
+        self.row_select_sprite = arcade.SpriteSolidColor(
+            4, 4, color=ROW_SELECTED_TINT
+        )
+        for sprite in (
+            *self.row_accent_sprites,
+            self.row_hover_sprite,
+            self.row_select_sprite,
+        ):
+            sprite.visible = False
+            self.icon_sprites.append(sprite)
+        self.tyre_sprites = [arcade.Sprite() for _ in range(20)]
+        self.drs_sprites = [arcade.SpriteCircle(16, F1_WHITE) for _ in range(20)]
+        self.weather_sprite = arcade.Sprite()
+        for sprite in (*self.tyre_sprites, *self.drs_sprites, self.weather_sprite):
+            sprite.visible = False
+            self.icon_sprites.append(sprite)
+
+        # Car markers: team color dot + small white highlight per driver,
+        # interleaved in one SpriteList so cars keep their draw order
+        self.car_sprites = arcade.SpriteList()
+        self._car_dots = []
+        self._car_glints = []
+        for col in self.driver_color_by_col:
+            dot = arcade.SpriteCircle(16, F1_WHITE)
+            dot.color = col
+            dot.size = (12, 12)
+            glint = arcade.SpriteCircle(16, F1_WHITE)
+            glint.color = (255, 255, 255, 120)
+            glint.size = (4, 4)
+            self.car_sprites.append(dot)
+            self.car_sprites.append(glint)
+            self._car_dots.append(dot)
+            self._car_glints.append(glint)
+        self._car_sel_col = None  # Driver column whose dot is drawn enlarged
 
         # ---------------------------
         # Pre-created Text objects for performance (avoid draw_text)
@@ -484,6 +635,14 @@ class F1ReplayWindow(arcade.Window):
             "PIT", 0, 0, F1_LIGHT_GRAY, 8, bold=True
         )
 
+        # Inputs each overlay's texts were last set up for, by overlay name
+        # (see _overlay_text_changed)
+        self._overlay_text_keys = {}
+
+        # Static geometry (track, panel backgrounds) lives in shape lists
+        self._rebuild_track_shapes()
+        self._rebuild_panel_shapes()
+
     # ---------------------------
     # Playback
     # ---------------------------
@@ -491,10 +650,11 @@ class F1ReplayWindow(arcade.Window):
         if self.paused:
             return
 
-        self.frame_idx += self.speed_choices[self.speed_i]
+        # Advance by wall-clock time so playback speed doesn't depend on tick rate
+        self.frame_idx += self._cur_speed * delta_time * self.fps
 
-        if self.frame_idx >= self.n_frames - 1:
-            self.frame_idx = self.n_frames - 1
+        if self.frame_idx >= self._last_frame:
+            self.frame_idx = self._last_frame
             self.paused = True
 
     # ---------------------------
@@ -508,20 +668,20 @@ class F1ReplayWindow(arcade.Window):
             return
 
         # Check if clicked on progress bar
-        if self.show_progress_bar and hasattr(self, "_progress_bar_rect"):
+        if self.show_progress_bar:
             bar_x, bar_y, bar_x2, bar_y2 = self._progress_bar_rect
             if bar_x <= x <= bar_x2 and bar_y <= y <= bar_y2:
                 # Calculate which frame to jump to
                 progress = (x - bar_x) / (bar_x2 - bar_x)
-                self.frame_idx = progress * (self.n_frames - 1)
-                self.frame_idx = max(0, min(self.frame_idx, self.n_frames - 1))
+                self.frame_idx = progress * self._last_frame
+                self.frame_idx = max(0, min(self.frame_idx, self._last_frame))
                 return
 
         # Check if clicked on leaderboard collapse/expand arrow
         if hasattr(self, "_lb_arrow_rect"):
             ax1, ay1, ax2, ay2 = self._lb_arrow_rect
             if ax1 <= x <= ax2 and ay1 <= y <= ay2:
-                self.leaderboard_collapsed = not self.leaderboard_collapsed
+                self._toggle_leaderboard()
                 return
 
         # Check leaderboard clicks
@@ -529,17 +689,211 @@ class F1ReplayWindow(arcade.Window):
         if idx is None:
             return
 
-        frame = self.frames[int(self.frame_idx)]
-        ordered = sorted(frame["drivers"].items(), key=lambda kv: kv[1]["pos"])
+        # Rows map to the order currently on screen (built for self._fi)
+        order = self._order
+        if idx < len(order):
+            self.selected_driver = self.driver_codes[order[idx]]
 
-        if 0 <= idx < len(ordered):
-            self.selected_driver = ordered[idx][0]
+    def _update_leaderboard_bounds(self):
+        """Cache leaderboard panel/row bounds; only changes on resize or collapse."""
+        panel_w = self.lb_w_collapsed if self.leaderboard_collapsed else self.lb_w
+        panel_x = self.width - panel_w - 20
+        # Height = title area + rows + bottom padding, anchored from the top
+        panel_h = self.lb_title_h + 8 + self._lb_n_rows * self.lb_row_h + 15
+        self._lb_panel_rect = (panel_x, self.height - 70 - panel_h, panel_w, panel_h)
+        self._lb_xl = panel_x + 6
+        self._lb_xr = panel_x + panel_w - 6
+        # Panel top is anchored at height - 70, rows start below the title
+        self._row_top = self.height - 70 - self.lb_title_h - 8
+        self._row_bottom = self._row_top - self._lb_n_rows * self.lb_row_h
+        self._inv_row_h = 1.0 / self.lb_row_h
+        # Top edge and vertical center of every row
+        self._row_tops = tuple(
+            self._row_top - idx * self.lb_row_h for idx in range(self._lb_n_rows)
+        )
+        self._row_cys = tuple(top - self.lb_row_h / 2 for top in self._row_tops)
+
+    def _update_track_screen_points(self):
+        # Whole polyline mapped world->screen in one vectorized transform
+        track_sx = np.asarray(self.track_x, dtype=np.float32) * self.world_scale
+        track_sy = np.asarray(self.track_y, dtype=np.float32) * self.world_scale
+        track_sx += self.world_tx
+        track_sy += self.world_ty
+        self.track_pts_screen = list(zip(track_sx.tolist(), track_sy.tolist()))
+
+    def _rebuild_track_shapes(self):
+        """
+        Rebuild the track polyline shapes and the start/finish line marker
+        from track_pts_screen.
+
+        The marker gets its own shape list: ShapeElementList batches by GL
+        mode, and the 1px center line is a GL line strip while the marker
+        lines are triangle strips, so in one list the center line would be
+        drawn over the marker.
+        """
+        self.track_shapes = arcade.shape_list.ShapeElementList()
+        self.start_finish_shapes = arcade.shape_list.ShapeElementList()
+        if len(self.track_pts_screen) < 2:
+            return
+        for color, line_width in TRACK_LAYERS:
+            self.track_shapes.append(
+                arcade.shape_list.create_line_strip(
+                    self.track_pts_screen, color, line_width
+                )
+            )
+        for shape in self._create_start_finish_line():
+            self.start_finish_shapes.append(shape)
+
+    def _rebuild_panel_shapes(self):
+        """
+        Rebuild the static panel backgrounds (leaderboard and its rows,
+        weather, telemetry box, progress bar) and lay out the leaderboard row
+        sprites. Called on resize and leaderboard collapse.
+        """
+        create = arcade.shape_list
+
+        self.panel_shapes = create.ShapeElementList()
+        for shape in (
+            create_f1_panel(*self._lb_panel_rect, 4)
+            + create_f1_panel(
+                self.weather_x, self.weather_y, self.weather_w, self.weather_h, 4
+            )
+            + create_f1_panel(
+                self.weather_x,
+                self.weather_y - self.driver_box_h - 15,
+                self.driver_box_w,
+                self.driver_box_h,
+                4,
+                show_red_accent=False,  # Team color accent is drawn per frame
+            )
+        ):
+            self.panel_shapes.append(shape)
+
+        # Leaderboard title (same layout as weather box) and row labels only
+        # move with the panel, so they are placed here rather than per frame
+        panel_x, panel_y, panel_w, panel_h = self._lb_panel_rect
+        self.lb_title.text = "LEADERBOARD" if not self.leaderboard_collapsed else "LB"
+        self.lb_title.position = (panel_x + 12, panel_y + panel_h - 12)
+        for idx in range(self._lb_n_rows):
+            self.lb_rows[idx].position = (
+                panel_x + self.lb_padding + 6,
+                self._row_tops[idx] - 4,
+            )
+            self.gap_texts[idx].position = (
+                panel_x + panel_w - 90,
+                self._row_cys[idx] - 7,
+            )
+
+        # Leaderboard rows: alternating backgrounds for readability, plus the
+        # team color accent bar and highlight sprites sized to each row
+        row_cx = panel_x + panel_w / 2
+        for idx, row_cy in enumerate(self._row_cys):
+            row_bg = ROW_BG_EVEN if idx % 2 == 0 else ROW_BG_ODD
+            self.panel_shapes.append(
+                create.create_rectangle_filled(
+                    row_cx, row_cy, panel_w - 12, self.lb_row_h - 2, row_bg
+                )
+            )
+            accent = self.row_accent_sprites[idx]
+            accent.size = (4, self.lb_row_h - 4)
+            accent.position = (panel_x + 8, row_cy)
+            accent.visible = True
+        for sprite in (self.row_hover_sprite, self.row_select_sprite):
+            sprite.size = (panel_w - 12, self.lb_row_h - 2)
+
+        # Collapse/expand arrow button, pointing left (to expand) when
+        # collapsed and right (to collapse) otherwise
+        arrow_x = panel_x + panel_w - 20
+        arrow_y = panel_y + panel_h - 16
+        arrow_size = -6 if self.leaderboard_collapsed else 6
+        self.panel_shapes.append(
+            create.create_polygon(
+                [
+                    (arrow_x - arrow_size, arrow_y - arrow_size),
+                    (arrow_x - arrow_size, arrow_y + arrow_size),
+                    (arrow_x + arrow_size, arrow_y),
+                ],
+                F1_LIGHT_GRAY,
+            )
+        )
+        # Store arrow click area for click detection
+        self._lb_arrow_rect = (arrow_x - 12, arrow_y - 12, arrow_x + 12, arrow_y + 12)
+
+        # Telemetry box: section dividers and throttle/brake bar backgrounds
+        # below the per-frame sprites, bar borders above them
+        box_x = self.weather_x
+        box_y = self.weather_y - self.driver_box_h - 15
+        box_w, box_h = self.driver_box_w, self.driver_box_h
+        self.driver_box_shapes = create.ShapeElementList()
+        self.driver_box_border_shapes = create.ShapeElementList()
+        for divider_y in (box_y + box_h - 130, box_y + box_h - 240):
+            self.driver_box_shapes.append(
+                create.create_line(
+                    box_x + 12, divider_y, box_x + box_w - 12, divider_y, F1_GRAY, 1
+                )
+            )
+        bar_x = box_x + box_w - 90
+        bar_y = box_y + 200
+        for x in (bar_x, bar_x + 40):  # Throttle, brake (30 x 100, 10 apart)
+            self.driver_box_shapes.append(
+                create.create_rectangle_filled(
+                    x + 15, bar_y + 50, 30, 100, F1_DARK_GRAY
+                )
+            )
+            self.driver_box_border_shapes.append(
+                create.create_rectangle_outline(x + 15, bar_y + 50, 30, 100, F1_GRAY, 1)
+            )
+        self._driver_accent_top.size = (box_w, 3)
+        self._driver_accent_top.position = (box_x + box_w / 2, box_y + box_h - 1.5)
+        self._driver_accent_left.size = (4, box_h - 20)
+        self._driver_accent_left.position = (box_x + 6, box_y + box_h / 2)
+        self._throttle_fill.center_x = bar_x + 15
+        self._brake_fill.center_x = bar_x + 55
+
+        # Progress bar: background, fill height, 1px border edges centered on
+        # the bar outline and the pixel car size (fill width and car x follow
+        # the playhead, see _draw_progress_bar)
+        bar_w = 700
+        bar_h = 8
+        bar_x = (self.width - bar_w) / 2
+        bar_y = 25  # Raised slightly to make room for car
+        self._progress_bar_geom = (bar_x, bar_y, bar_w, bar_h)
+        # Bar bounds for click detection (include car area)
+        self._progress_bar_rect = (
+            bar_x,
+            bar_y - 10,
+            bar_x + bar_w,
+            bar_y + bar_h + self.pixel_car_size + 10,
+        )
+        cx = bar_x + bar_w / 2
+        cy = bar_y + bar_h / 2
+        self._progress_bg.size = (bar_w, bar_h)
+        self._progress_bg.position = (cx, cy)
+        self._progress_fill.height = bar_h
+        self._progress_fill.center_y = cy
+        bottom, top, left, right = self._progress_edges
+        bottom.size = top.size = (bar_w + 1, 1)
+        left.size = right.size = (1, bar_h + 1)
+        bottom.position = (cx, bar_y)
+        top.position = (cx, bar_y + bar_h)
+        left.position = (bar_x, cy)
+        right.position = (bar_x + bar_w, cy)
+        self._progress_fill_w = None  # Fill width (px) last shown; None = stale
+        if self._progress_car is not None:
+            # Car height fixed, width from the texture's aspect ratio
+            car_tex = self._progress_car.texture
+            car_h = self.pixel_car_size
+            self._progress_car.size = (car_h * car_tex.width / car_tex.height, car_h)
+            self._progress_car.center_y = cy + car_h / 2 + 2
 
     def _leaderboard_row_at(self, x: float, y: float):
-        for idx, (l, b, r, t) in enumerate(self._lb_rects):
-            if l <= x <= r and b <= y <= t:
-                return idx
-        return None
+        if not (
+            self._lb_xl <= x <= self._lb_xr
+            and self._row_bottom <= y <= self._row_top
+        ):
+            return None
+        idx = int((self._row_top - y) * self._inv_row_h)
+        return idx if idx < self._lb_n_rows else None
 
     # ---------------------------
     # Drawing
@@ -547,81 +901,74 @@ class F1ReplayWindow(arcade.Window):
     def on_draw(self):
         self.clear()
 
-        frame = self.frames[int(self.frame_idx)]
+        fi = int(self.frame_idx)
+        frame = self.frames[fi]
+
+        # Derived per-frame state only changes when the playhead (or the world
+        # transform) moves; while paused, redraws just replay the cached view
+        if self._dirty or fi != self._fi:
+            self._dirty = False
+            self._fi = fi
+            self._update_frame_view(fi)
 
-        # Track - F1 broadcast style (clean, professional)
+        # Track - F1 broadcast style (clean, professional), see TRACK_LAYERS,
+        # then the start/finish line marker on top
         if len(self.track_pts_screen) >= 2:
-            # Track shadow/outline
-            arcade.draw_line_strip(self.track_pts_screen, (30, 30, 35), 12)
-            # Main track surface
-            arcade.draw_line_strip(self.track_pts_screen, (55, 55, 60), 8)
-            # Racing line
-            arcade.draw_line_strip(self.track_pts_screen, (100, 100, 105), 3)
-            # Center line
-            arcade.draw_line_strip(self.track_pts_screen, (140, 140, 145), 1)
-
-            # Draw start/finish line marker
-            self._draw_start_finish_line()
-
-        # Cars - clean F1 broadcast style
-        for drv, st in frame["drivers"].items():
-            sx, sy = world_to_screen(
-                st["x"], st["y"], self.world_scale, self.world_tx, self.world_ty
+            self.track_shapes.draw()
+            self.start_finish_shapes.draw()
+
+        # Cars - clean F1 broadcast style (sprites placed by _update_frame_view)
+        car_sx, car_sy = self._car_sx, self._car_sy
+
+        # Selected driver's dot is drawn larger (radius 8 instead of 6)
+        sel = self.driver_col.get(self.selected_driver)
+        if sel != self._car_sel_col:
+            if self._car_sel_col is not None:
+                self._car_dots[self._car_sel_col].size = (12, 12)
+            if sel is not None:
+                self._car_dots[sel].size = (16, 16)
+            self._car_sel_col = sel
+
+        # Selected driver highlight ring, then all car dots in one draw
+        if sel is not None:
+            arcade.draw_circle_outline(
+                float(car_sx[sel]), float(car_sy[sel]), 12, F1_WHITE, 2
             )
-            col = self.driver_colors.get(drv, arcade.color.WHITE)
-
-            r = 6
-            if self.selected_driver == drv:
-                r = 8
-                # Selected driver highlight ring
-                arcade.draw_circle_outline(sx, sy, 12, F1_WHITE, 2)
-
-            # Car dot with team color
-            arcade.draw_circle_filled(sx, sy, r, col)
-            # Small white highlight
-            arcade.draw_circle_filled(sx - 1, sy + 1, 2, (255, 255, 255, 120))
+        self.car_sprites.draw()
 
         # HUD - Lap counter and race time
-        # Calculate current lap from leader
-        ordered = sorted(frame["drivers"].items(), key=lambda kv: kv[1]["pos"])
-        leader_lap = int(ordered[0][1].get("lap", 1)) if ordered else 1
-
-        # Use total_laps if available, otherwise use max lap from current frame
-        if self.total_laps:
-            display_total = self.total_laps
-        else:
-            display_total = (
-                max(int(st.get("lap", 1)) for _, st in ordered) if ordered else 1
+        # Only re-format (and re-layout) the HUD when a displayed value changes
+        leader_lap, display_total, whole_secs = self._hud_frame_state
+        speed = self._cur_speed
+        hud_state = (leader_lap, display_total, whole_secs, speed)
+        if hud_state != self._last_hud_state:
+            self._last_hud_state = hud_state
+            minutes, seconds = divmod(whole_secs, 60)
+            self.lap_text.text = f"LAP {leader_lap}/{display_total}"
+            self.race_time_text.text = (
+                f"Race Time: {minutes:02d}:{seconds:02d} (x{speed})"
             )
 
-        # Get fastest lap driver from frame data (properly tracked in frames.py)
-        fastest_lap_info = frame.get("fastest_lap", {})
-        if fastest_lap_info.get("driver"):
-            self.fastest_lap_driver = fastest_lap_info["driver"]
-            self.fastest_lap_time = fastest_lap_info.get("time", float("inf"))
-
-        self.lap_text.text = f"LAP {leader_lap}/{display_total}"
-        speed = self.speed_choices[self.speed_i]
-        t = frame["t"]
-        minutes = int(t // 60)
-        seconds = int(t % 60)
-        self.race_time_text.text = f"Race Time: {minutes:02d}:{seconds:02d} (x{speed})"
-
-        # Draw GP/Session info at top center
-        self.gp_title_text.draw()
-        self.session_text.draw()
-
-        # Draw lap and race time (top left)
-        self.lap_text.draw()
-        self.race_time_text.draw()
+        # HUD text (GP/session info, lap counter, race time) in one batch,
+        # under the panels and pop-ups below
+        self.hud_text_batch.draw()
 
         # UI panels (can be toggled off)
         if self.show_ui:
-            self._draw_leaderboard(frame)
+            # Position order + interval gaps in that order, shared by panels
+            order = self._order
+            gaps = self._gaps
+
+            # Static panel backgrounds in one shape-list draw
+            self.panel_shapes.draw()
+
+            self._draw_leaderboard(fi, order, gaps)
             self._draw_weather(frame)
-            self._draw_driver_boxes(frame)
-            # Draw controls at bottom left
-            self.controls_text.draw()
+            self._draw_driver_boxes(frame, fi, order, gaps)
+            # Tyre/DRS/weather icons placed by the panels above, one draw
+            self.icon_sprites.draw()
+            # Batched UI text (panel labels above, controls at bottom left)
+            self.ui_text_batch.draw()
 
             # New UI components
             self._draw_track_status(frame)
@@ -634,149 +981,93 @@ class F1ReplayWindow(arcade.Window):
         if self.show_progress_bar:
             self._draw_progress_bar(frame)
 
-    def _draw_leaderboard(self, frame):
-        # Determine panel width based on collapsed state
-        if self.leaderboard_collapsed:
-            panel_w = 115  # Collapsed width - just position and driver name
+    def _update_frame_view(self, fi):
+        """
+        Recompute the state derived from frame fi: car sprite positions,
+        position order, interval gaps and the HUD lap/time values.
+        """
+        F = self.F
+
+        # Whole field mapped world->screen in one vector op (reused buffers)
+        car_sx, car_sy = self._car_sx, self._car_sy
+        np.multiply(F["x"][fi], self.world_scale, out=car_sx)
+        np.multiply(F["y"][fi], self.world_scale, out=car_sy)
+        car_sx += self.world_tx
+        car_sy += self.world_ty
+        for dot, glint, sx, sy in zip(
+            self._car_dots, self._car_glints, car_sx.tolist(), car_sy.tolist()
+        ):
+            dot.position = (sx, sy)
+            glint.position = (sx - 1, sy + 1)
+
+        # Position order + interval gaps in that order, shared by panels
+        self._order = self.frame_order[fi]
+        self._gaps = self.frame_gaps[fi].tolist()
+
+        # Current lap from the leader; total from total_laps if available,
+        # otherwise the max lap in the current frame
+        leader_lap = int(self.leader_lap_per_frame[fi])
+        if self.total_laps:
+            display_total = self.total_laps
         else:
-            panel_w = self.lb_w  # Full width
+            display_total = int(self.max_lap_per_frame[fi])
+        self._hud_frame_state = (leader_lap, display_total, int(F["t"][fi]))
 
-        panel_x = self.width - panel_w - 20
-
-        # Calculate actual panel height based on number of drivers
-        ordered = sorted(frame["drivers"].items(), key=lambda kv: kv[1]["pos"])
-        num_drivers = min(len(ordered), 20)
-
-        # Height = title area + rows + bottom padding
-        # Title area: 32 (title_h) + 8 (gap to first row)
-        # Rows: num_drivers * 25 (row_h)
-        # Bottom padding: 15
-        panel_h = self.lb_title_h + 8 + num_drivers * self.lb_row_h + 15
+        # Get fastest lap driver from frame data (properly tracked in frames.py)
+        fastest_lap_info = self.frames[fi].get("fastest_lap", {})
+        if fastest_lap_info.get("driver"):
+            self.fastest_lap_driver = fastest_lap_info["driver"]
+            self.fastest_lap_time = fastest_lap_info.get("time", float("inf"))
 
-        # Anchor from top (keep top position same as original)
-        # Original top was at: self.lb_y + self.lb_h = 50 + (height - 120) = height - 70
-        panel_top = self.height - 70
-        panel_y = panel_top - panel_h
+    def _draw_leaderboard(self, fi, order, gaps):
+        # Panel rect follows the collapsed state (see _update_leaderboard_bounds);
+        # its background is part of panel_shapes
+        panel_x, panel_y, panel_w, panel_h = self._lb_panel_rect
 
-        # F1 Broadcast style panel with red accent
-        draw_f1_panel(panel_x, panel_y, panel_w, panel_h, 4)
+        F = self.F
+        codes = self.driver_codes
+        num_drivers = self._lb_n_rows
 
         # Default selection = leader
-        if self.selected_driver is None and ordered:
-            self.selected_driver = ordered[0][0]
-
-        # Title (same layout as weather box) - use Text object for performance
-        self.lb_title.text = "LEADERBOARD" if not self.leaderboard_collapsed else "LB"
-        self.lb_title.x = panel_x + 12
-        self.lb_title.y = panel_y + panel_h - 12
-        self.lb_title.draw()
-
-        # Draw collapse/expand arrow button
-        arrow_x = panel_x + panel_w - 20
-        arrow_y = panel_y + panel_h - 16
-        arrow_size = 6
-
-        # Store arrow click area for click detection
-        self._lb_arrow_rect = (arrow_x - 12, arrow_y - 12, arrow_x + 12, arrow_y + 12)
-
-        if self.leaderboard_collapsed:
-            # Arrow pointing left (to expand)
-            arcade.draw_triangle_filled(
-                arrow_x + arrow_size,
-                arrow_y - arrow_size,
-                arrow_x + arrow_size,
-                arrow_y + arrow_size,
-                arrow_x - arrow_size,
-                arrow_y,
-                F1_LIGHT_GRAY,
-            )
-        else:
-            # Arrow pointing right (to collapse)
-            arcade.draw_triangle_filled(
-                arrow_x - arrow_size,
-                arrow_y - arrow_size,
-                arrow_x - arrow_size,
-                arrow_y + arrow_size,
-                arrow_x + arrow_size,
-                arrow_y,
-                F1_LIGHT_GRAY,
-            )
-
-        # Precompute progress + speed lists matching the ordered list (for interval gaps)
-        prog_list = [float(st.get("progress", 0.0)) for _, st in ordered]
-        spd_list_kmh = [float(st.get("speed", 0.0)) for _, st in ordered]
-
-        # Build row rects for click detection
-        self._lb_rects = []
-
-        # Row start (top anchor)
-        top_y = panel_y + panel_h - self.lb_title_h - 8
+        if self.selected_driver is None and num_drivers:
+            self.selected_driver = codes[order[0]]
+
+        # Per-field rows for this frame as lists, indexed by driver column
+        pos_row = F["pos"][fi].tolist()
+        comp_row = F["compound"][fi].tolist()
+        drs_row = self.drs_active[fi].tolist()
+
+        # Loop invariants bound to locals: row centers (see
+        # _update_leaderboard_bounds), per-row widgets and caches
+        row_cys = self._row_cys
+        colors = self.driver_color_by_col
+        accents = self.row_accent_sprites
+        rows = self.lb_rows
+        row_cache = self._lb_row_cache
+        gap_texts = self.gap_texts
+        gap_cache = self._gap_cache
+        tyre_sprites = self.tyre_sprites
+        tyre_textures = self.tyre_texture_by_code
+        tyre_size = self.tyre_icon_size
+        drs_sprites = self.drs_sprites
+        fastest_driver = self.fastest_lap_driver
+        show_columns = not self.leaderboard_collapsed
 
         # Columns (adjust for collapsed state)
-        x_text = panel_x + self.lb_padding
-        x_gap = panel_x + panel_w - 90
         x_tyre = panel_x + panel_w - 52
         x_drs = panel_x + panel_w - 20
 
-        for idx, (drv, st) in enumerate(ordered[:20]):
-            row_top = top_y - idx * self.lb_row_h
-            row_bottom = row_top - self.lb_row_h
-            row_cy = (row_top + row_bottom) / 2
-
-            # Save click rect
-            self._lb_rects.append(
-                (panel_x + 6, row_bottom, panel_x + panel_w - 6, row_top)
-            )
-
-            # F1 broadcast style row backgrounds
-            pos = int(st["pos"])
-
-            # Alternating row backgrounds for readability
-            if idx % 2 == 0:
-                row_bg = (35, 35, 45, 200)
-            else:
-                row_bg = (28, 28, 38, 200)
-
-            rect = arcade.XYWH(
-                panel_x + panel_w / 2,
-                row_cy,
-                panel_w - 12,
-                self.lb_row_h - 2,
-            )
-            arcade.draw_rect_filled(rect, row_bg)
-
-            # Team color left accent bar (F1 signature style)
-            col = self.driver_colors.get(drv, arcade.color.WHITE)
-            arcade.draw_lrbt_rectangle_filled(
-                panel_x + 6,
-                panel_x + 10,
-                row_bottom + 2,
-                row_top - 2,
-                col,
-            )
-
-            # Hover highlight
-            if self.hover_index == idx:
-                rect = arcade.XYWH(
-                    panel_x + panel_w / 2,
-                    row_cy,
-                    panel_w - 12,
-                    self.lb_row_h - 2,
-                )
-                arcade.draw_rect_filled(rect, (255, 255, 255, 25))
+        for idx, di in enumerate(order[:num_drivers].tolist()):
+            drv = codes[di]
+            row_cy = row_cys[idx]
+            pos = pos_row[di]
 
-            # Selected highlight (red tint like F1 TV)
-            if self.selected_driver == drv:
-                rect = arcade.XYWH(
-                    panel_x + panel_w / 2,
-                    row_cy,
-                    panel_w - 12,
-                    self.lb_row_h - 2,
-                )
-                arcade.draw_rect_filled(rect, (*F1_RED[:3], 50))
+            # Team color left accent bar (F1 signature style); the row
+            # background is in panel_shapes
+            accents[idx].color = colors[di]
 
             # Position number with special colors for podium
-            if drv == self.fastest_lap_driver:
+            if drv == fastest_driver:
                 pos_color = FASTEST_PURPLE
             elif pos == 1:
                 pos_color = P1_GOLD
@@ -787,65 +1078,86 @@ class F1ReplayWindow(arcade.Window):
             else:
                 pos_color = F1_WHITE
 
-            # Driver text
-            self.lb_rows[idx].text = f"{pos:>2}. {drv}"
-            self.lb_rows[idx].x = x_text + 6
-            self.lb_rows[idx].y = row_top - 4
-            self.lb_rows[idx].color = pos_color
-            self.lb_rows[idx].draw()
+            # Driver text (only touch the label when its content changed)
+            row_key = (f"{pos:>2}. {drv}", pos_color)
+            if row_cache[idx] != row_key:
+                row_cache[idx] = row_key
+                row_text = rows[idx]
+                row_text.text, row_text.color = row_key
 
             # Only show additional columns if not collapsed
-            if not self.leaderboard_collapsed:
-                # Gap/interval
-                if idx == 0:
-                    gap_str = "LEADER"
-                    self.gap_texts[idx].color = F1_WHITE
-                else:
-                    gap_m = max(0.0, prog_list[idx - 1] - prog_list[idx])
-                    spd_ahead_mps = max(spd_list_kmh[idx - 1] / 3.6, 1.0)
-                    spd_this_mps = max(spd_list_kmh[idx] / 3.6, 1.0)
-                    avg_speed_mps = max(0.5 * (spd_ahead_mps + spd_this_mps), 1.0)
-                    gap_s = gap_m / avg_speed_mps
-                    gap_str = f"+{gap_s:.1f}"
-                    self.gap_texts[idx].color = INTERVAL_YELLOW
-
-                self.gap_texts[idx].text = gap_str
-                self.gap_texts[idx].x = x_gap
-                self.gap_texts[idx].y = row_cy - 7
-                self.gap_texts[idx].draw()
-
-                # Tyre icon
-                key = _compound_key(st.get("compound", None))
-                tex = self.tyre_textures.get(key) or self.tyre_textures.get("unknown")
-                if tex is not None:
-                    rect = arcade.XYWH(
-                        x_tyre,
-                        row_cy,
-                        self.tyre_icon_size,
-                        self.tyre_icon_size,
-                    )
-                    arcade.draw_texture_rect(rect=rect, texture=tex, angle=0, alpha=255)
+            if show_columns:
+                # Gap/interval, quantized to the 0.1s shown so the label is
+                # only rebuilt when the displayed digit actually changes
+                gap_q = -1 if idx == 0 else int(gaps[idx - 1] * 10 + 0.5)
+                if gap_cache[idx] != gap_q:
+                    gap_cache[idx] = gap_q
+                    gap_text = gap_texts[idx]
+                    if gap_q < 0:
+                        gap_text.text = "LEADER"
+                        gap_text.color = F1_WHITE
+                    else:
+                        gap_text.text = f"+{gap_q // 10}.{gap_q % 10}"
+                        gap_text.color = INTERVAL_YELLOW
+
+                # Tyre icon (sprite, drawn with icon_sprites)
+                _place_icon(
+                    tyre_sprites[idx],
+                    tyre_textures[comp_row[di]],
+                    x_tyre,
+                    row_cy,
+                    tyre_size,
+                )
 
-                # DRS indicator
-                drs_on = _drs_is_active(int(st.get("drs", 0)))
-                if drs_on:
-                    arcade.draw_circle_filled(x_drs, row_cy, 5, DRS_GREEN)
+                # DRS indicator (sprite, drawn with icon_sprites)
+                drs_dot = drs_sprites[idx]
+                if drs_row[di]:
+                    drs_dot.color = DRS_GREEN
+                    drs_dot.size = (10, 10)
                 else:
-                    arcade.draw_circle_filled(x_drs, row_cy, 4, F1_GRAY)
-            else:
-                # Clear gap text when collapsed
-                self.gap_texts[idx].text = ""
-
-        # Clear unused rows
-        for j in range(len(ordered), 20):
+                    drs_dot.color = F1_GRAY
+                    drs_dot.size = (8, 8)
+                drs_dot.position = (x_drs, row_cy)
+                drs_dot.visible = True
+
+        # Hover and selected highlights over their rows
+        sel_di = self.driver_col.get(self.selected_driver)
+        sel_idx = None if sel_di is None else int(self.frame_rank[fi, sel_di])
+        for sprite, idx in (
+            (self.row_hover_sprite, self.hover_index),
+            (self.row_select_sprite, sel_idx),
+        ):
+            if idx is None or not 0 <= idx < num_drivers:
+                sprite.visible = False
+                continue
+            sprite.position = (panel_x + panel_w / 2, row_cys[idx])
+            sprite.visible = True
+
+        # Clear rows left over from a longer board (only when the count drops)
+        for j in range(num_drivers, self._lb_prev_n):
             self.lb_rows[j].text = ""
             self.gap_texts[j].text = ""
+            self._lb_row_cache[j] = None
+            self._gap_cache[j] = None
+            self.tyre_sprites[j].visible = False
+            self.drs_sprites[j].visible = False
+        self._lb_prev_n = num_drivers
+
+        # Columns are cleared once when the board collapses, not every frame
+        if self.leaderboard_collapsed and self._lb_cols_shown:
+            self._clear_leaderboard_columns()
+        self._lb_cols_shown = not self.leaderboard_collapsed
+
+    def _clear_leaderboard_columns(self):
+        # Gap text, tyre icon and DRS dot of every row
+        for idx in range(self._lb_n_rows):
+            self.gap_texts[idx].text = ""
+            self._gap_cache[idx] = None
+            self.tyre_sprites[idx].visible = False
+            self.drs_sprites[idx].visible = False
 
     def _draw_weather(self, frame):
-        # F1 broadcast style weather panel
-        draw_f1_panel(self.weather_x, self.weather_y, self.weather_w, self.weather_h, 4)
-
-        self.weather_title.draw()
+        # F1 broadcast style weather panel (background is in panel_shapes)
 
         # Get weather data
         weather = frame.get("weather", {})
@@ -855,18 +1167,23 @@ class F1ReplayWindow(arcade.Window):
         rainfall = weather.get("Rainfall", False)
         wind_speed = weather.get("WindSpeed", 0) if "WindSpeed" in weather else 0
 
-        # Weather icon
+        # Weather icon (sprite, drawn with icon_sprites)
         icon_key = "rain" if rainfall else ("cloudy" if humidity > 70 else "clear")
-        tex = self.weather_textures.get(icon_key)
-        if tex is not None:
-            icon_x = self.weather_x + self.weather_w - self.weather_icon_size - 10
-            icon_y = self.weather_y + self.weather_h - self.weather_icon_size - 10
-            rect = arcade.XYWH(
-                icon_x, icon_y, self.weather_icon_size, self.weather_icon_size
-            )
-            arcade.draw_texture_rect(rect=rect, texture=tex, angle=0, alpha=255)
+        icon_x = self.weather_x + self.weather_w - self.weather_icon_size - 10
+        icon_y = self.weather_y + self.weather_h - self.weather_icon_size - 10
+        _place_icon(
+            self.weather_sprite,
+            self.weather_textures.get(icon_key),
+            icon_x,
+            icon_y,
+            self.weather_icon_size,
+        )
 
-        # Weather info lines
+        # Weather info lines, re-formatted only when a reading changes
+        weather_key = (track_temp, air_temp, humidity, wind_speed, rainfall)
+        if weather_key == self._weather_cache:
+            return
+        self._weather_cache = weather_key
         lines = [
             f"Track: {track_temp:.1f}C" if track_temp > 0 else "Track: --",
             f"Air: {air_temp:.1f}C" if air_temp > 0 else "Air: --",
@@ -877,112 +1194,98 @@ class F1ReplayWindow(arcade.Window):
 
         for i, text in enumerate(lines):
             self.weather_lines[i].text = text
-            self.weather_lines[i].draw()
 
-    def _draw_driver_boxes(self, frame):
+    def _draw_driver_boxes(self, frame, fi, order, gaps):
         # Only show selected driver's telemetry
         if self.selected_driver is None:
             # Default to leader if none selected
-            ordered = sorted(frame["drivers"].items(), key=lambda kv: kv[1]["pos"])
-            if ordered:
-                self.selected_driver = ordered[0][0]
+            if len(order):
+                self.selected_driver = self.driver_codes[order[0]]
             else:
+                self._set_driver_box_visible(False)
                 return
 
-        if self.selected_driver not in frame["drivers"]:
-            return
-
-        # Get selected driver data
-        st = frame["drivers"][self.selected_driver]
+        # Selected driver's column in the frame arrays
         drv = self.selected_driver
+        di = self.driver_col.get(drv)
+        if di is None:
+            self._set_driver_box_visible(False)
+            return
+        self._set_driver_box_visible(True)
         box = self.driver_boxes[0]
 
-        # Get all drivers ordered by position for gap calculations
-        ordered = sorted(frame["drivers"].items(), key=lambda kv: kv[1]["pos"])
-        driver_idx = next((i for i, (d, _) in enumerate(ordered) if d == drv), -1)
-
         # Calculate box position (below weather)
         box_x = self.weather_x
         box_y = self.weather_y - self.driver_box_h - 15
 
-        # Driver color
-        driver_col = self.driver_colors.get(drv, arcade.color.WHITE)
-
-        # F1 broadcast style driver panel
-        draw_f1_panel(
-            box_x,
-            box_y,
-            self.driver_box_w,
-            self.driver_box_h,
-            4,
-            show_red_accent=False,  # Use team color instead
-        )
-
-        # Team color accent bar on top (instead of red)
-        arcade.draw_lrbt_rectangle_filled(
-            box_x,
-            box_x + self.driver_box_w,
-            box_y + self.driver_box_h - 3,
-            box_y + self.driver_box_h,
-            driver_col,
-        )
-
-        # Team color left accent bar
-        arcade.draw_lrbt_rectangle_filled(
-            box_x + 4,
-            box_x + 8,
-            box_y + 10,
-            box_y + self.driver_box_h - 10,
-            driver_col,
-        )
-
-        # Driver info
-        speed = float(st.get("speed", 0.0))
-        gear = int(st.get("gear", 0))
-        drs = int(st.get("drs", 0))
-        pos = int(st.get("pos", 0))
-
-        throttle_val = min(max(float(st.get("throttle", 0)), 0.0), 100.0)
-        # Brake can be 0-100 percentage or boolean (0/1), normalize to 0-100
-        raw_brake = float(st.get("brake", 0))
-        brake_val = min(
-            max(raw_brake * 100.0 if raw_brake <= 1.0 else raw_brake, 0.0), 100.0
-        )
+        # Labels only change with the frame, the driver or the layout
+        text_key = (fi, di, box_x, box_y)
+        if text_key != self._driver_box_text_key:
+            self._driver_box_text_key = text_key
+            self._update_driver_box_text(box, frame, fi, di, order, gaps, box_x, box_y)
+
+        # Team color accents (top and left) and throttle/brake fill heights;
+        # throttle/brake are already 0-100 from build_frame_arrays, which is
+        # also the bar height in pixels
+        driver_col = self.driver_color_by_col[di]
+        self._driver_accent_top.color = driver_col
+        self._driver_accent_left.color = driver_col
+        bar_bottom = box_y + 200
+        for fill, val in (
+            (self._throttle_fill, int(self.F["throttle"][fi, di])),
+            (self._brake_fill, int(self.F["brake"][fi, di])),
+        ):
+            fill.visible = val > 0
+            if val > 0:
+                fill.height = val
+                fill.center_y = bar_bottom + val / 2
+
+        # F1 broadcast style driver panel (background is in panel_shapes):
+        # static bar backgrounds and dividers, then the accents and fills,
+        # then the bar borders on top
+        self.driver_box_shapes.draw()
+        self.driver_box_sprites.draw()
+        self.driver_box_border_shapes.draw()
+
+    def _update_driver_box_text(self, box, frame, fi, di, order, gaps, box_x, box_y):
+        """
+        Refresh the batched labels of the telemetry box for driver column di
+        at frame fi.
+        """
+        F = self.F
+        drv = self.driver_codes[di]
+
+        # Selected driver's place in the position order, for gap calculations
+        driver_idx = int(self.frame_rank[fi, di])
+
+        speed = float(F["speed"][fi, di])
+        gear = int(F["gear"][fi, di])
+        drs_on = bool(self.drs_active[fi, di])
 
         # Calculate gaps
-        prog_list = [float(s.get("progress", 0)) for _, s in ordered]
-        spd_list = [float(s.get("speed", 1)) for _, s in ordered]
-
         gap_ahead = ""
         gap_behind = ""
 
         if driver_idx > 0:
-            gap_m = max(0.0, prog_list[driver_idx - 1] - prog_list[driver_idx])
-            spd_ahead = max(spd_list[driver_idx - 1] / 3.6, 1.0)
-            spd_this = max(spd_list[driver_idx] / 3.6, 1.0)
-            avg_spd = max(0.5 * (spd_ahead + spd_this), 1.0)
-            gap_s = gap_m / avg_spd
-            gap_ahead = f"+{gap_s:.1f}s"
-
-        if driver_idx < len(ordered) - 1:
-            gap_m = max(0.0, prog_list[driver_idx] - prog_list[driver_idx + 1])
-            spd_behind = max(spd_list[driver_idx + 1] / 3.6, 1.0)
-            spd_this = max(spd_list[driver_idx] / 3.6, 1.0)
-            avg_spd = max(0.5 * (spd_behind + spd_this), 1.0)
-            gap_s = gap_m / avg_spd
-            gap_behind = f"-{gap_s:.1f}s"
+            gap_ahead = f"+{gaps[driver_idx - 1]:.1f}s"
+
+        if driver_idx < len(order) - 1:
+            gap_behind = f"-{gaps[driver_idx]:.1f}s"
 
         # Title
         box["title"].text = f"{drv}"
-        box["title"].color = driver_col
+        box["title"].color = self.driver_color_by_col[di]
         box["title"].x = box_x + 15
         box["title"].y = box_y + self.driver_box_h - 10
-        box["title"].draw()
 
-        # Info lines
+        # Info lines (speed and gear/DRS from the string pools)
         lines = [
-            f"Speed: {speed:.0f} km/h",
-            f"Gear: {gear}   DRS: {'ON' if _drs_is_active(drs) else 'OFF'}",
+            self._speed_str[round(speed)]
+            if 0 <= speed < 400
+            else f"Speed: {speed:.0f} km/h",
+            self._gear_drs_str[drs_on][gear]
+            if 0 <= gear < 10
+            else f"Gear: {gear}   DRS: {'ON' if drs_on else 'OFF'}",
             f"Ahead: {gap_ahead}" if gap_ahead else "Ahead: ---",
             f"Behind: {gap_behind}" if gap_behind else "Behind: ---",
         ]
@@ -991,39 +1294,26 @@ class F1ReplayWindow(arcade.Window):
             box["lines"][i].text = text
             box["lines"][i].x = box_x + 15
             box["lines"][i].y = box_y + self.driver_box_h - 35 - i * 22
-            box["lines"][i].draw()
-
-        # Divider line
-        divider_y = box_y + self.driver_box_h - 130
-        arcade.draw_line(
-            box_x + 12, divider_y, box_x + self.driver_box_w - 12, divider_y, F1_GRAY, 1
-        )
 
         # --- SECTOR TIMES SECTION ---
-        sector_y = divider_y - 18
+        sector_y = box_y + self.driver_box_h - 130 - 18
         box["sector_title"].x = box_x + 15
         box["sector_title"].y = sector_y
-        box["sector_title"].draw()
 
-        # Get sector times and overall bests
-        sector_times = st.get("sector_times", {})
+        # Sector times (NaN = not set yet) and overall bests
         overall_bests = frame.get("overall_bests", {})
 
-        sectors = [
-            ("s1", sector_times.get("s1"), overall_bests.get("s1")),
-            ("s2", sector_times.get("s2"), overall_bests.get("s2")),
-            ("s3", sector_times.get("s3"), overall_bests.get("s3")),
-        ]
-
         sector_y -= 22
-        for i, (key, time_val, best_val) in enumerate(sectors):
+        for i, key in enumerate(("s1", "s2", "s3")):
+            time_val = float(F[key][fi, di])
+            best_val = overall_bests.get(key)
+
             # Label
             box["sector_labels"][i].x = box_x + 15
             box["sector_labels"][i].y = sector_y - i * 20
-            box["sector_labels"][i].draw()
 
             # Value with color
-            if time_val is None:
+            if math.isnan(time_val):
                 box["sector_values"][i].text = "---"
                 box["sector_values"][i].color = F1_LIGHT_GRAY
             else:
@@ -1035,32 +1325,25 @@ class F1ReplayWindow(arcade.Window):
 
             box["sector_values"][i].x = box_x + 130
             box["sector_values"][i].y = sector_y - i * 20
-            box["sector_values"][i].draw()
-
-        # Divider line
-        divider_y2 = sector_y - 70
-        arcade.draw_line(
-            box_x + 12,
-            divider_y2,
-            box_x + self.driver_box_w - 12,
-            divider_y2,
-            F1_GRAY,
-            1,
-        )
 
         # --- TYRE STRATEGY SECTION ---
-        tyre_y = divider_y2 - 18
+        tyre_y = box_y + self.driver_box_h - 240 - 18
         box["tyre_title"].x = box_x + 15
         box["tyre_title"].y = tyre_y
-        box["tyre_title"].draw()
 
-        stint = st.get("stint", 1)
-        tyre_life = st.get("tyre_life", 0)
-        pit_count = st.get("pit_count", 0)
-        compound = st.get("compound", "Unknown")
+        stint = int(F["stint"][fi, di])
+        tyre_life = int(F["tyre_life"][fi, di])
+        pit_count = int(F["pit_count"][fi, di])
+        compound = int(F["compound"][fi, di])
+        if compound:
+            compound_line = self._compound_str[compound]
+        else:
+            # Unrecognised or missing: show the raw compound as before
+            raw = frame["drivers"][self.driver_codes[di]].get("compound")
+            compound_line = f"Compound: {raw[:3].upper() if raw else '---'}"
 
         tyre_lines = [
-            f"Compound: {compound[:3].upper() if compound else '---'}",
+            compound_line,
             f"Age: {tyre_life} laps",
             f"Stint: {stint}  Pits: {pit_count}",
         ]
@@ -1070,110 +1353,75 @@ class F1ReplayWindow(arcade.Window):
             box["tyre_lines"][i].text = text
             box["tyre_lines"][i].x = box_x + 15
             box["tyre_lines"][i].y = tyre_y - i * 20
-            box["tyre_lines"][i].draw()
 
-        # F1 broadcast style throttle and brake bars (right side)
-        bar_w = 30
-        bar_h = 100
+        # THR/BRK labels centered above the 30x100 bars
         bar_x = box_x + self.driver_box_w - 90
-        bar_y = box_y + 200
-
-        # Throttle bar background
-        arcade.draw_lrbt_rectangle_filled(
-            bar_x, bar_x + bar_w, bar_y, bar_y + bar_h, F1_DARK_GRAY
-        )
-        if throttle_val > 0:
-            fill_h = (throttle_val / 100.0) * bar_h
-            arcade.draw_lrbt_rectangle_filled(
-                bar_x, bar_x + bar_w, bar_y, bar_y + fill_h, DRS_GREEN
-            )
-        arcade.draw_lrbt_rectangle_outline(
-            bar_x, bar_x + bar_w, bar_y, bar_y + bar_h, F1_GRAY, 1
-        )
-
-        # Throttle label
+        label_y = box_y + 200 + 100 + 10
         box["throttle_pct"].text = "THR"
-        box["throttle_pct"].x = bar_x + bar_w / 2
-        box["throttle_pct"].y = bar_y + bar_h + 10
-        box["throttle_pct"].draw()
-
-        # Brake bar background
-        brake_x = bar_x + bar_w + 10
-        arcade.draw_lrbt_rectangle_filled(
-            brake_x, brake_x + bar_w, bar_y, bar_y + bar_h, F1_DARK_GRAY
-        )
-        if brake_val > 0:
-            fill_h = (brake_val / 100.0) * bar_h
-            arcade.draw_lrbt_rectangle_filled(
-                brake_x, brake_x + bar_w, bar_y, bar_y + fill_h, F1_RED
-            )
-        arcade.draw_lrbt_rectangle_outline(
-            brake_x, brake_x + bar_w, bar_y, bar_y + bar_h, F1_GRAY, 1
-        )
-
-        # Brake label
+        box["throttle_pct"].x = bar_x + 15
+        box["throttle_pct"].y = label_y
         box["brake_pct"].text = "BRK"
-        box["brake_pct"].x = brake_x + bar_w / 2
-        box["brake_pct"].y = bar_y + bar_h + 10
-        box["brake_pct"].draw()
+        box["brake_pct"].x = bar_x + 55
+        box["brake_pct"].y = label_y
+
+    def _set_driver_box_visible(self, visible: bool):
+        # Batched labels are drawn whether or not the box is, so hide them
+        if visible == self._driver_box_visible:
+            return
+        self._driver_box_visible = visible
+        for box in self.driver_boxes:
+            for text in box["all_texts"]:
+                text.visible = visible
 
     def _draw_progress_bar(self, frame):
         # F1 broadcast style progress bar with pixel car playhead
-        bar_w = 700
-        bar_h = 8
-        bar_x = (self.width - bar_w) / 2
-        bar_y = 25  # Raised slightly to make room for car
+        bar_x, bar_y, bar_w, bar_h = self._progress_bar_geom
 
-        # Background
-        arcade.draw_lrbt_rectangle_filled(
-            bar_x,
-            bar_x + bar_w,
-            bar_y,
-            bar_y + bar_h,
-            F1_DARK_GRAY,
-        )
-
-        # Progress calculation
+        # Filled portion (F1 red) and the car centered on the progress point,
+        # in whole pixels so the sprites only move when the drawn bar changes
         progress = self.frame_idx / max(self.n_frames - 1, 1)
-        fill_w = progress * bar_w
-
-        # Filled portion (F1 red)
-        if fill_w > 0:
-            arcade.draw_lrbt_rectangle_filled(
-                bar_x,
-                bar_x + fill_w,
-                bar_y,
-                bar_y + bar_h,
-                F1_RED,
-            )
-
-        # Border
-        arcade.draw_lrbt_rectangle_outline(
-            bar_x,
-            bar_x + bar_w,
-            bar_y,
-            bar_y + bar_h,
-            F1_GRAY,
-            1,
-        )
-
-        # Draw pixel car as playhead
-        if self.pixel_car_texture is not None:
-            # Calculate car position (car center at progress point)
-            car_x = bar_x + fill_w
-            car_y = bar_y + bar_h / 2
-
-            # Calculate car dimensions maintaining aspect ratio
-            aspect_ratio = self.pixel_car_texture.width / self.pixel_car_texture.height
-            car_h = self.pixel_car_size
-            car_w = car_h * aspect_ratio
-
-            # Draw the car
-            rect = arcade.XYWH(car_x, car_y + car_h / 2 + 2, car_w, car_h)
-            arcade.draw_texture_rect(rect=rect, texture=self.pixel_car_texture, angle=0, alpha=255)
-
-        # Store bar bounds for click detection (include car area)
-        self._progress_bar_rect = (bar_x, bar_y - 10, bar_x + bar_w, bar_y + bar_h + self.pixel_car_size + 10)
+        fill_w = int(progress * bar_w)
+        if fill_w != self._progress_fill_w:
+            self._progress_fill_w = fill_w
+            fill = self._progress_fill
+            fill.visible = fill_w > 0
+            if fill_w > 0:
+                fill.width = fill_w
+                fill.center_x = bar_x + fill_w / 2
+            if self._progress_car is not None:
+                self._progress_car.center_x = bar_x + fill_w
+
+        self.progress_sprites.draw()
+
+    def _draw_overlay_panel(self, x, y, width, height, color=None, radius=4):
+        """
+        Draw a pop-up panel: an F1 panel, or a plain rounded rectangle when a
+        color is given. Each geometry is built into a shape list once and
+        reused (the cache is cleared on resize).
+        """
+        key = (x, y, width, height, color, radius)
+        shapes = self._overlay_shapes.get(key)
+        if shapes is None:
+            if color is None:
+                parts = create_f1_panel(x, y, width, height, radius)
+            else:
+                parts = create_rounded_rectangle(x, y, width, height, color, radius)
+            shapes = arcade.shape_list.ShapeElementList()
+            for shape in parts:
+                shapes.append(shape)
+            self._overlay_shapes[key] = shapes
+        shapes.draw()
+
+    def _overlay_text_changed(self, name, key):
+        """
+        Whether the texts of overlay name need setting up for key (what they
+        show and where). Unchanged overlays skip the setters, color in
+        particular, which rewrites the label's vertices even when unchanged.
+        """
+        if self._overlay_text_keys.get(name) == key:
+            return False
+        self._overlay_text_keys[name] = key
+        return True
 
     def _draw_track_status(self, frame):
         """Draw track status indicator (GREEN/YELLOW/RED/SC/VSC)."""
@@ -1201,13 +1449,16 @@ class F1ReplayWindow(arcade.Window):
         badge_y = self.height - 75
 
         # Background
-        draw_rounded_rectangle(badge_x, badge_y, badge_w, badge_h, (*color, 230), 4)
+        self._draw_overlay_panel(badge_x, badge_y, badge_w, badge_h, (*color, 230))
 
         # Text (using pre-created Text object)
-        self.track_status_text.text = text
-        self.track_status_text.x = self.width // 2
-        self.track_status_text.y = badge_y + badge_h // 2
-        self.track_status_text.color = F1_WHITE if status != "YELLOW" else F1_BLACK
+        if self._overlay_text_changed("track_status", (status, self.width, badge_y)):
+            self.track_status_text.text = text
+            self.track_status_text.x = self.width // 2
+            self.track_status_text.y = badge_y + badge_h // 2
+            self.track_status_text.color = (
+                F1_WHITE if status != "YELLOW" else F1_BLACK
+            )
         self.track_status_text.draw()
 
     def _draw_fastest_lap_banner(self, frame):
@@ -1222,11 +1473,6 @@ class F1ReplayWindow(arcade.Window):
         if not driver or not lap_time:
             return
 
-        # Format time as M:SS.mmm
-        minutes = int(lap_time // 60)
-        seconds = lap_time % 60
-        time_str = f"{minutes}:{seconds:06.3f}"
-
         # Draw banner
         banner_w = 320
         banner_h = 40
@@ -1234,14 +1480,20 @@ class F1ReplayWindow(arcade.Window):
         banner_y = self.height - 120
 
         # Purple background (fastest lap color)
-        draw_rounded_rectangle(
-            banner_x, banner_y, banner_w, banner_h, (*FASTEST_PURPLE, 240), 4
+        self._draw_overlay_panel(
+            banner_x, banner_y, banner_w, banner_h, (*FASTEST_PURPLE, 240)
         )
 
-        # Text (using pre-created Text object)
-        self.fastest_lap_text.text = f"FASTEST LAP - {driver} - {time_str}"
-        self.fastest_lap_text.x = self.width // 2
-        self.fastest_lap_text.y = banner_y + banner_h // 2
+        # Text (using pre-created Text object), time as M:SS.mmm
+        if self._overlay_text_changed(
+            "fastest_lap", (driver, lap_time, self.width, banner_y)
+        ):
+            minutes = int(lap_time // 60)
+            seconds = lap_time % 60
+            time_str = f"{minutes}:{seconds:06.3f}"
+            self.fastest_lap_text.text = f"FASTEST LAP - {driver} - {time_str}"
+            self.fastest_lap_text.x = self.width // 2
+            self.fastest_lap_text.y = banner_y + banner_h // 2
         self.fastest_lap_text.draw()
 
     def _draw_race_messages(self, frame):
@@ -1251,12 +1503,19 @@ class F1ReplayWindow(arcade.Window):
         if not messages:
             return
 
+        # Draw up to 2 most recent messages
+        messages = messages[:2]
+        shown = [(msg.get("type", ""), msg.get("message", "")) for msg in messages]
+        if not self._overlay_text_changed("race_messages", (shown, self.width)):
+            for i in range(len(shown)):
+                self.race_msg_texts[i].draw()
+            return
+
         # Position above progress bar
         msg_x = self.width // 2
         msg_y = 45
 
-        # Draw up to 2 most recent messages
-        for i, msg in enumerate(messages[:2]):
+        for i, msg in enumerate(messages):
             msg_type = msg.get("type", "")
             message = msg.get("message", "")
 
@@ -1283,7 +1542,7 @@ class F1ReplayWindow(arcade.Window):
         """Draw recent overtakes feed."""
         # Update overtake tracking from frame data
         position_changes = frame.get("position_changes", [])
-        current_time = frame.get("t", 0)
+        current_time = frame["t"]
 
         # Add new overtakes
         for change in position_changes:
@@ -1314,13 +1573,23 @@ class F1ReplayWindow(arcade.Window):
         panel_x = 20
         panel_y = 200
 
-        draw_f1_panel(panel_x, panel_y, panel_w, panel_h, 4)
+        self._draw_overlay_panel(panel_x, panel_y, panel_w, panel_h)
 
         # Title (using pre-created Text object)
         self.overtakes_title_text.x = panel_x + 12
         self.overtakes_title_text.y = panel_y + panel_h - 12
         self.overtakes_title_text.draw()
 
+        num_texts = min(num_items, len(self.overtake_item_texts))
+        shown = [
+            (o.get("driver", ""), o.get("passed", ""), o.get("new_pos", 0))
+            for o in self.recent_overtakes
+        ]
+        if not self._overlay_text_changed("overtakes", shown):
+            for idx in range(num_texts):
+                self.overtake_item_texts[idx].draw()
+            return
+
         y_offset = panel_y + panel_h - 48
         for idx, overtake in enumerate(reversed(self.recent_overtakes)):
             if idx >= len(self.overtake_item_texts):
@@ -1344,7 +1613,7 @@ class F1ReplayWindow(arcade.Window):
 
     def _draw_pit_summary(self, frame):
         """Draw recent pit stops summary."""
-        current_time = frame.get("t", 0)
+        current_time = frame["t"]
 
         # Get pit stops from pit_data
         pit_stops = self.pit_data.get("pit_stops", [])
@@ -1368,7 +1637,7 @@ class F1ReplayWindow(arcade.Window):
         panel_x = self.lb_x
         panel_y = self.lb_y - panel_h - 10
 
-        draw_f1_panel(panel_x, panel_y, panel_w, panel_h, 4)
+        self._draw_overlay_panel(panel_x, panel_y, panel_w, panel_h)
 
         # Title (using pre-created Text object)
         self.pit_stops_title_text.x = panel_x + 12
@@ -1409,13 +1678,20 @@ class F1ReplayWindow(arcade.Window):
         panel_x = self.width - panel_w - 20
         panel_y = 45
 
-        draw_f1_panel(panel_x, panel_y, panel_w, panel_h, 4)
+        self._draw_overlay_panel(panel_x, panel_y, panel_w, panel_h)
 
         # Title (using pre-created Text object)
         self.top_speeds_title_text.x = panel_x + 12
         self.top_speeds_title_text.y = panel_y + panel_h - 12
         self.top_speeds_title_text.draw()
 
+        # Top speeds are fixed for the session, so the entries only need
+        # setting up again when the panel moves
+        if not self._overlay_text_changed("top_speeds", (panel_x, panel_y)):
+            for text in self.top_speed_item_texts[: len(top_speeds)]:
+                text.draw()
+            return
+
         y_offset = panel_y + panel_h - 48
         for i, speed_entry in enumerate(top_speeds[:3]):
             if i >= len(self.top_speed_item_texts):
@@ -1432,12 +1708,10 @@ class F1ReplayWindow(arcade.Window):
             self.top_speed_item_texts[i].draw()
             y_offset -= 30
 
-    def _draw_start_finish_line(self):
-        """Draw start/finish line on the track."""
+    def _create_start_finish_line(self):
+        """Shapes for the start/finish line on the track."""
         if len(self.track_pts_screen) < 2:
-            return
-
-        import math
+            return []
 
         # Get first two track points to determine direction
         x0, y0 = self.track_pts_screen[0]
@@ -1447,7 +1721,7 @@ class F1ReplayWindow(arcade.Window):
         dx, dy = x1 - x0, y1 - y0
         length = math.sqrt(dx * dx + dy * dy)
         if length < 0.001:
-            return
+            return []
 
         # Perpendicular unit vector
         px, py = -dy / length, dx / length
@@ -1455,25 +1729,26 @@ class F1ReplayWindow(arcade.Window):
         # Draw checkered-style start/finish line
         line_half_len = 15
 
-        # Draw white line
-        arcade.draw_line(
-            x0 - px * line_half_len,
-            y0 - py * line_half_len,
-            x0 + px * line_half_len,
-            y0 + py * line_half_len,
-            F1_WHITE,
-            4,
-        )
-
-        # Draw smaller red accent
-        arcade.draw_line(
-            x0 - px * line_half_len * 0.5,
-            y0 - py * line_half_len * 0.5,
-            x0 + px * line_half_len * 0.5,
-            y0 + py * line_half_len * 0.5,
-            F1_RED,
-            2,
-        )
+        return [
+            # White line
+            arcade.shape_list.create_line(
+                x0 - px * line_half_len,
+                y0 - py * line_half_len,
+                x0 + px * line_half_len,
+                y0 + py * line_half_len,
+                F1_WHITE,
+                4,
+            ),
+            # Smaller red accent
+            arcade.shape_list.create_line(
+                x0 - px * line_half_len * 0.5,
+                y0 - py * line_half_len * 0.5,
+                x0 + px * line_half_len * 0.5,
+                y0 + py * line_half_len * 0.5,
+                F1_RED,
+                2,
+            ),
+        ]
 
     def _draw_pit_lane(self):
         """Draw pit lane indicator (simplified - just marks pit entry area)."""
@@ -1499,75 +1774,95 @@ class F1ReplayWindow(arcade.Window):
         # Draw small marker
         arcade.draw_circle_outline(pit_x, pit_y, 8, F1_LIGHT_GRAY, 1)
 
+    def _toggle_pause(self):
+        self.paused = not self.paused
+
+    def _restart(self):
+        self.frame_idx = 0.0
+        self.paused = False
+
+    def _toggle_ui(self):
+        self.show_ui = not self.show_ui
+
+    def _toggle_progress_bar(self):
+        self.show_progress_bar = not self.show_progress_bar
+
+    def _toggle_leaderboard(self):
+        self.leaderboard_collapsed = not self.leaderboard_collapsed
+        self._update_leaderboard_bounds()
+        self._rebuild_panel_shapes()
+
+    def _speed_up(self):
+        self.speed_i = min(self.speed_i + 1, len(self.speed_choices) - 1)
+        self._cur_speed = self.speed_choices[self.speed_i]
+
+    def _speed_down(self):
+        self.speed_i = max(self.speed_i - 1, 0)
+        self._cur_speed = self.speed_choices[self.speed_i]
+
+    def _seek_forward(self):
+        self.frame_idx = min(self.frame_idx + self._seek_step, self._last_frame)
+
+    def _seek_back(self):
+        self.frame_idx = max(self.frame_idx - self._seek_step, 0)
+
+    def _toggle_fullscreen(self):
+        self.set_fullscreen(not self.fullscreen)
+
     def on_key_press(self, symbol: int, modifiers: int):
-        if symbol == arcade.key.SPACE:
-            self.paused = not self.paused
-        elif symbol == arcade.key.R:
-            self.frame_idx = 0.0
-            self.paused = False
-        elif symbol == arcade.key.H:
-            self.show_ui = not self.show_ui
-        elif symbol == arcade.key.P:
-            self.show_progress_bar = not self.show_progress_bar
-        elif symbol == arcade.key.L:
-            self.leaderboard_collapsed = not self.leaderboard_collapsed
-        elif symbol == arcade.key.UP:
-            self.speed_i = min(self.speed_i + 1, len(self.speed_choices) - 1)
-        elif symbol == arcade.key.DOWN:
-            self.speed_i = max(self.speed_i - 1, 0)
-        elif symbol == arcade.key.RIGHT:
-            self.frame_idx = min(self.frame_idx + self.fps * 5, self.n_frames - 1)
-        elif symbol == arcade.key.LEFT:
-            self.frame_idx = max(self.frame_idx - self.fps * 5, 0)
-        elif symbol == arcade.key.F or symbol == arcade.key.F11:
-            # Toggle fullscreen
-            self.set_fullscreen(not self.fullscreen)
+        handler = self._key_handlers.get(symbol)
+        if handler is not None:
+            handler()
 
     def on_resize(self, width: int, height: int):
         """Handle window resize - recalculate UI positions."""
         super().on_resize(width, height)
 
+        # pyglet also fires resize on focus/restore with an unchanged size;
+        # the layout below only depends on the size, so skip rebuilding it
+        if (width, height) == self._last_resize_size:
+            return
+        self._last_resize_size = (width, height)
+
         # Update leaderboard position (right side)
         self.lb_x = width - self.lb_w - 20
         self.lb_h = height - 120
         self.lb_y = 50
 
-        # Update leaderboard title position
-        self.lb_title.x = self.lb_x + self.lb_padding
-        self.lb_title.y = self.lb_y + self.lb_h - 10
+        # Leaderboard row hit-test bounds
+        self._update_leaderboard_bounds()
 
         # Update weather box position (top left, below lap info)
         self.weather_y = height - 210
 
         # Update weather title and lines positions
-        self.weather_title.x = self.weather_x + 12
-        self.weather_title.y = self.weather_y + self.weather_h - 12
+        self.weather_title.position = (
+            self.weather_x + 12,
+            self.weather_y + self.weather_h - 12,
+        )
         for i, line in enumerate(self.weather_lines):
-            line.x = self.weather_x + 12
-            line.y = self.weather_y + self.weather_h - 35 - i * 20
+            line.position = (
+                self.weather_x + 12,
+                self.weather_y + self.weather_h - 35 - i * 20,
+            )
+
+        # Panel backgrounds depend on window size
+        self._rebuild_panel_shapes()
+        self._overlay_shapes.clear()
 
         # Update HUD text positions
-        self.gp_title_text.x = width // 2
-        self.gp_title_text.y = height - 20
-        self.session_text.x = width // 2
-        self.session_text.y = height - 42
+        self.gp_title_text.position = (width // 2, height - 20)
+        self.session_text.position = (width // 2, height - 42)
         self.lap_text.y = height - 25
         self.race_time_text.y = height - 48
 
         # Recalculate track transform for new window size
-        from src.track import compute_bounds, build_world_to_screen_transform
-
-        xmin, xmax, ymin, ymax = compute_bounds(self.track_x, self.track_y, pad=50.0)
+        xmin, xmax, ymin, ymax = self._track_bounds
         self.world_scale, self.world_tx, self.world_ty = (
             build_world_to_screen_transform(xmin, xmax, ymin, ymax, width, height)
         )
 
         # Recompute track screen coordinates
-        from src.track import world_to_screen
-
-        self.track_pts_screen = []
-        for x, y in zip(self.track_x, self.track_y):
-            sx, sy = world_to_screen(
-                float(x), float(y), self.world_scale, self.world_tx, self.world_ty
-            )
-            self.track_pts_screen.append((sx, sy))
+        self._update_track_screen_points()
+        self._rebuild_track_shapes()
+        self._dirty = True  # Car positions depend on the world transform
@@ -1,5 +1,7 @@
 import numpy as np
 
+from src.tyres import compound_code
+
 
 def _norm_lap_distance(dist: float, lap_length: float) -> float:
     """
@@ -365,3 +367,155 @@ def build_frames(
         })
 
     return frames
+
+
+# Optional driver state keys and the value used when a state (e.g. from an
+# older replay cache) lacks them. The frames themselves are left untouched.
+_DRIVER_DEFAULTS = {
+    "drs": 0,
+    "lap": 1,
+    "gear": 0,
+    "compound": None,
+    "throttle": 0.0,
+    "brake": 0.0,
+    "stint": 1,
+    "tyre_life": 0,
+    "pit_count": 0,
+}
+
+
+def _brake_percent(brake: np.ndarray) -> np.ndarray:
+    """
+    Brake can be 0-100 percentage or boolean (0/1), normalize to 0-100.
+    """
+    return np.where(brake <= 1.0, brake * 100.0, brake)
+
+
+def _to_percent_u8(values: np.ndarray) -> np.ndarray:
+    """
+    Quantize a 0-100 percentage to uint8 (whole percent is all the UI shows).
+    """
+    return np.rint(np.clip(values, 0.0, 100.0)).astype(np.uint8)
+
+
+# Per-driver array fields in build order: (name, dtype). Each driver state
+# is read into one row of values in this order (see _driver_values).
+_DRIVER_FIELDS = (
+    ("x", np.float32),
+    ("y", np.float32),
+    ("pos", np.int8),
+    ("lap", np.int16),
+    ("drs", np.uint8),
+    ("speed", np.float32),
+    ("progress", np.float32),
+    ("gear", np.int8),
+    ("throttle", np.float32),
+    ("brake", np.float32),
+    ("stint", np.int8),
+    ("tyre_life", np.int16),
+    ("pit_count", np.int8),
+    ("compound", np.uint8),
+    ("s1", np.float64),
+    ("s2", np.float64),
+    ("s3", np.float64),
+)
+
+# Frames converted per block, bounding the temporary float64 table
+_BUILD_BLOCK_FRAMES = 4096
+
+_NO_SECTOR_TIMES = {}
+
+
+class _CompoundCodes(dict):
+    """compound_code memoized by compound string (a race has only a few)."""
+
+    def __missing__(self, compound):
+        code = self[compound] = compound_code(compound)
+        return code
+
+
+def _driver_values(st: dict, compound_codes: _CompoundCodes) -> tuple:
+    """One driver state as a row of _DRIVER_FIELDS values (None -> NaN)."""
+    get = st.get
+    sectors = get("sector_times") or _NO_SECTOR_TIMES
+    return (
+        st["x"],
+        st["y"],
+        st["pos"],
+        get("lap", _DRIVER_DEFAULTS["lap"]),
+        get("drs", _DRIVER_DEFAULTS["drs"]),
+        st["speed"],
+        st["progress"],
+        get("gear", _DRIVER_DEFAULTS["gear"]),
+        get("throttle", _DRIVER_DEFAULTS["throttle"]),
+        get("brake", _DRIVER_DEFAULTS["brake"]),
+        get("stint", _DRIVER_DEFAULTS["stint"]),
+        get("tyre_life", _DRIVER_DEFAULTS["tyre_life"]),
+        get("pit_count", _DRIVER_DEFAULTS["pit_count"]),
+        compound_codes[get("compound")],
+        sectors.get("s1"),
+        sectors.get("s2"),
+        sectors.get("s3"),
+    )
+
+
+def build_frame_arrays(frames: list):
+    """
+    Convert per-frame driver dicts into columnar (SoA) NumPy arrays.
+
+    Every driver gets a fixed column index, so per-frame reads in the
+    renderer become array indexing instead of dict lookups. Each field uses
+    the narrowest dtype that holds its range (throttle/brake are whole
+    percent in uint8, brake already normalized to 0-100). Sector times are
+    float64 with NaN for a sector not yet set.
+
+    Driver states are read in a single pass, block by block. Keys missing
+    from a driver state take their _DRIVER_DEFAULTS value; the input frames
+    are not modified.
+
+    Returns:
+      driver_codes: list[str], column j of every array belongs to driver_codes[j]
+      arrays: dict[field] -> np.ndarray of shape (n_frames, n_drivers),
+              except "t" which has shape (n_frames,)
+    """
+    n_frames = len(frames)
+    driver_codes = list(frames[0]["drivers"].keys()) if frames else []
+    n_drivers = len(driver_codes)
+
+    columns = {
+        name: np.empty((n_frames, n_drivers), dtype=dtype)
+        for name, dtype in _DRIVER_FIELDS
+    }
+    compound_codes = _CompoundCodes()
+    for start in range(0, n_frames, _BUILD_BLOCK_FRAMES):
+        block = frames[start : start + _BUILD_BLOCK_FRAMES]
+        values = np.array(
+            [
+                _driver_values(fr["drivers"][d], compound_codes)
+                for fr in block
+                for d in driver_codes
+            ],
+            dtype=np.float64,
+        ).reshape(len(block), n_drivers, len(_DRIVER_FIELDS))
+        for k, (name, _) in enumerate(_DRIVER_FIELDS):
+            columns[name][start : start + len(block)] = values[..., k]
+
+    arrays = {"t": np.array([fr["t"] for fr in frames], dtype=np.float32)}
+    arrays.update(columns)
+    arrays["throttle"] = _to_percent_u8(columns["throttle"])
+    arrays["brake"] = _to_percent_u8(_brake_percent(columns["brake"]))
+
+    return driver_codes, arrays
+
+
+def interval_gaps(progress: np.ndarray, speed_kmh: np.ndarray) -> np.ndarray:
+    """
+    Time gaps (seconds) between consecutive cars, along the last axis.
+
+    Inputs must already be in position order (leader first). Element k is
+    the gap from car k to car k+1: distance between them divided by their
+    average speed (each clamped to >= 1 m/s so a stopped car doesn't blow up).
+    """
+    spd_mps = np.maximum(speed_kmh / 3.6, 1.0)
+    gap_m = np.maximum(progress[..., :-1] - progress[..., 1:], 0.0)
+    return gap_m / (0.5 * (spd_mps[..., :-1] + spd_mps[..., 1:]))
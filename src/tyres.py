@@ -31,3 +31,29 @@ def build_tyre_map(session) -> dict:
         tyre_map[code] = lap_to_comp
 
     return tyre_map
+
+
+# Integer codes for tyre compounds (index into COMPOUND_KEYS)
+COMPOUND_KEYS = ("unknown", "soft", "medium", "hard", "intermediate", "wet")
+
+
+# FastF1 compound name prefix and code, by the prefix's first three letters
+_COMPOUND_PREFIXES = {
+    "SOF": ("SOFT", 1),
+    "MED": ("MED", 2),
+    "HAR": ("HARD", 3),
+    "INT": ("INTER", 4),
+    "WET": ("WET", 5),
+}
+
+
+def compound_code(compound: str | None) -> int:
+    """
+    Normalize a FastF1 compound string to a small integer code.
+    0 = unknown, otherwise the index of the key in COMPOUND_KEYS.
+    """
+    if not compound:
+        return 0
+    c = compound.strip().upper()
+    prefix, code = _COMPOUND_PREFIXES.get(c[:3], ("", 0))
+    return code if prefix and c.startswith(prefix) else 0
@@ -0,0 +1,106 @@
+"""
+Shared F1 broadcast palette and panel shapes for the replay and analysis windows.
+"""
+
+import functools
+import math
+
+import arcade
+
+# Official F1 colors
+F1_RED = (225, 6, 0)  # Official F1 red
+F1_BLACK = (21, 21, 30)  # Near-black background
+F1_DARK_GRAY = (38, 38, 48)  # Panel backgrounds
+F1_GRAY = (68, 68, 78)  # Secondary elements
+F1_WHITE = (255, 255, 255)  # Primary text
+F1_LIGHT_GRAY = (180, 180, 185)  # Secondary text
+FASTEST_PURPLE = (170, 0, 255)
+
+# Panel colors
+PANEL_BG = (28, 28, 38, 240)
+PANEL_BG_ALT = (38, 38, 50, 240)
+
+
+@functools.lru_cache(maxsize=None)
+def _quarter_arc(start_deg, segments):
+    """Unit-circle points of the quarter arc starting at start_deg."""
+    return tuple(
+        (math.cos(a), math.sin(a))
+        for a in (
+            math.radians(start_deg + 90 * k / segments) for k in range(segments + 1)
+        )
+    )
+
+
+def _rounded_rect_outline(x, y, width, height, radius, segments=6):
+    """Outline points of a rounded rectangle, counter-clockwise."""
+    corners = (
+        (x + width - radius, y + radius, -90),
+        (x + width - radius, y + height - radius, 0),
+        (x + radius, y + height - radius, 90),
+        (x + radius, y + radius, 180),
+    )
+    return [
+        (cx + radius * ux, cy + radius * uy)
+        for cx, cy, start in corners
+        for ux, uy in _quarter_arc(start, segments)
+    ]
+
+
+def create_rounded_rectangle(x, y, width, height, color, radius=10, segments=6):
+    """
+    Create the shapes for a filled rounded rectangle, for a ShapeElementList.
+
+    The outline is one convex triangle strip, so it lands in the same batch as
+    plain rectangles and keeps its draw order. An inner rect is added on top
+    so translucent colors get the same double coverage in the interior as the
+    two overlapping body rects the panels were originally drawn with.
+    """
+    create = arcade.shape_list
+    radius = max(0, min(radius, width / 2, height / 2))
+    if radius <= 0:
+        return [
+            create.create_rectangle_filled(
+                x + width / 2, y + height / 2, width, height, color
+            )
+        ]
+
+    # Outline points counter-clockwise, one quarter arc per corner
+    outline = _rounded_rect_outline(x, y, width, height, radius, segments)
+
+    # Zig-zag the convex outline into a strip: 0, 1, n-1, 2, n-2, ...
+    n = len(outline)
+    strip = [outline[0]]
+    lo, hi = 1, n - 1
+    while lo <= hi:
+        strip.append(outline[lo])
+        if lo != hi:
+            strip.append(outline[hi])
+        lo += 1
+        hi -= 1
+
+    return [
+        create.create_triangles_strip_filled_with_colors(strip, [color] * len(strip)),
+        create.create_rectangle_filled(
+            x + width / 2,
+            y + height / 2,
+            width - 2 * radius,
+            height - 2 * radius,
+            color,
+        ),
+    ]
+
+
+def create_f1_panel(x, y, width, height, radius=4, show_red_accent=True):
+    """
+    Shapes for an F1 broadcast style panel with optional red accent line, for
+    use in a ShapeElementList.
+    """
+    shapes = create_rounded_rectangle(x, y, width, height, PANEL_BG, radius)
+    if show_red_accent:
+        shapes.append(
+            arcade.shape_list.create_rectangle_filled(
+                x + width / 2, y + height - 1.5, width, 3, F1_RED
+            )
+        )
+    return shapes
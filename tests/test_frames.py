@@ -0,0 +1,157 @@
+import copy
+
+import numpy as np
+import pytest
+
+from src.frames import build_frame_arrays, interval_gaps
+
+
+def _baseline_gap(prog_ahead, prog_this, spd_ahead_kmh, spd_this_kmh):
+    """Per-row interval gap as the leaderboard used to compute it."""
+    gap_m = max(0.0, prog_ahead - prog_this)
+    spd_ahead_mps = max(spd_ahead_kmh / 3.6, 1.0)
+    spd_this_mps = max(spd_this_kmh / 3.6, 1.0)
+    avg_speed_mps = max(0.5 * (spd_ahead_mps + spd_this_mps), 1.0)
+    return gap_m / avg_speed_mps
+
+
+# Leader first; includes a stopped car and a car "ahead" on progress of the
+# car in front of it (gap clamps to zero)
+PROGRESS = [5000.0, 4950.0, 4700.0, 4720.0, 3000.0]
+SPEED_KMH = [300.0, 250.0, 0.0, 0.0, 0.0]
+
+
+def test_interval_gaps_matches_baseline_formula():
+    gaps = interval_gaps(np.array(PROGRESS), np.array(SPEED_KMH))
+
+    # No entry for the leader: element k is the gap from car k to car k+1
+    assert gaps.shape == (len(PROGRESS) - 1,)
+    expected = [
+        _baseline_gap(PROGRESS[k - 1], PROGRESS[k], SPEED_KMH[k - 1], SPEED_KMH[k])
+        for k in range(1, len(PROGRESS))
+    ]
+    np.testing.assert_allclose(gaps, expected)
+    # Both cars stopped: distance over the 1 m/s floor
+    assert gaps[-1] == pytest.approx(1720.0)
+    assert gaps[2] == 0.0
+
+
+def test_interval_gaps_works_per_frame_along_last_axis():
+    progress = np.array([PROGRESS, PROGRESS[::-1]])
+    speed = np.array([SPEED_KMH, SPEED_KMH[::-1]])
+
+    gaps = interval_gaps(progress, speed)
+
+    assert gaps.shape == (2, len(PROGRESS) - 1)
+    for fi in range(2):
+        np.testing.assert_allclose(gaps[fi], interval_gaps(progress[fi], speed[fi]))
+
+
+def _state(**overrides):
+    st = {
+        "x": 1.0,
+        "y": 2.0,
+        "pos": 1,
+        "lap": 3,
+        "drs": 12,
+        "speed": 250.0,
+        "progress": 1000.0,
+        "gear": 7,
+        "throttle": 99.6,
+        "brake": 0.0,
+        "stint": 2,
+        "tyre_life": 5,
+        "pit_count": 1,
+        "compound": "MEDIUM",
+        "sector_times": {"s1": 30.5, "s2": None, "s3": None},
+    }
+    st.update(overrides)
+    return st
+
+
+def _frames():
+    # VER has every key; HAM only the required ones
+    minimal = {"x": 3.0, "y": 4.0, "pos": 2, "speed": 240.0, "progress": 990.0}
+    return [
+        {"t": 0.0, "drivers": {"VER": _state(), "HAM": dict(minimal)}},
+        {
+            "t": 0.04,
+            "drivers": {
+                "HAM": dict(minimal, brake=1.0),
+                "VER": _state(x=1.5, compound="INTERMEDIATE"),
+            },
+        },
+    ]
+
+
+def test_build_frame_arrays_shapes_and_dtypes():
+    codes, arrays = build_frame_arrays(_frames())
+
+    # Columns follow the first frame's driver order
+    assert codes == ["VER", "HAM"]
+    assert arrays["t"].shape == (2,)
+    expected_dtypes = {
+        "x": np.float32,
+        "y": np.float32,
+        "pos": np.int8,
+        "lap": np.int16,
+        "drs": np.uint8,
+        "speed": np.float32,
+        "progress": np.float32,
+        "gear": np.int8,
+        "throttle": np.uint8,
+        "brake": np.uint8,
+        "stint": np.int8,
+        "tyre_life": np.int16,
+        "pit_count": np.int8,
+        "compound": np.uint8,
+        "s1": np.float64,
+        "s2": np.float64,
+        "s3": np.float64,
+    }
+    for field, dtype in expected_dtypes.items():
+        assert arrays[field].shape == (2, 2), field
+        assert arrays[field].dtype == dtype, field
+
+
+def test_build_frame_arrays_values_and_defaults():
+    _, a = build_frame_arrays(_frames())
+
+    # Full state (column 0), read by driver code in both frames
+    assert a["x"][:, 0].tolist() == [1.0, 1.5]
+    assert a["lap"][0, 0] == 3 and a["drs"][0, 0] == 12
+    assert a["throttle"][0, 0] == 100  # Rounded to whole percent
+    assert a["compound"][:, 0].tolist() == [2, 4]  # medium, intermediate
+    assert a["s1"][0, 0] == 30.5
+    assert np.isnan(a["s2"][0, 0]) and np.isnan(a["s3"][0, 0])
+
+    # Missing optional keys take their defaults (column 1)
+    assert a["pos"][0, 1] == 2
+    assert a["lap"][0, 1] == 1
+    assert a["drs"][0, 1] == 0
+    assert a["gear"][0, 1] == 0
+    assert a["throttle"][0, 1] == 0
+    assert a["stint"][0, 1] == 1
+    assert a["tyre_life"][0, 1] == 0
+    assert a["pit_count"][0, 1] == 0
+    assert a["compound"][0, 1] == 0
+    assert np.isnan(a["s1"][:, 1]).all()
+    # Boolean brake is normalized to 0-100
+    assert a["brake"][:, 1].tolist() == [0, 100]
+
+
+def test_build_frame_arrays_leaves_frames_untouched():
+    frames = _frames()
+    before = copy.deepcopy(frames)
+
+    build_frame_arrays(frames)
+
+    assert frames == before
+
+
+def test_build_frame_arrays_empty():
+    codes, arrays = build_frame_arrays([])
+
+    assert codes == []
+    assert arrays["t"].shape == (0,)
+    assert arrays["x"].shape == (0, 0)
@@ -0,0 +1,33 @@
+import pytest
+
+from src.tyres import COMPOUND_KEYS, compound_code
+
+
+@pytest.mark.parametrize(
+    "compound, key",
+    [
+        ("SOFT", "soft"),
+        ("MEDIUM", "medium"),
+        ("HARD", "hard"),
+        ("INTERMEDIATE", "intermediate"),
+        ("WET", "wet"),
+        ("UNKNOWN", "unknown"),
+        ("TEST_UNKNOWN", "unknown"),
+        (None, "unknown"),
+        ("", "unknown"),
+        # Case and surrounding whitespace are ignored
+        (" soft ", "soft"),
+        ("Intermediate", "intermediate"),
+        # Pre-2019 names are not mapped
+        ("SUPERSOFT", "unknown"),
+        ("HYPERSOFT", "unknown"),
+        # Only the full prefixes match, not their first three letters
+        ("SOF", "unknown"),
+        ("HAR", "unknown"),
+        ("INT", "unknown"),
+        ("IN", "unknown"),
+        ("MED", "medium"),
+    ],
+)
+def test_compound_code_matches_compound_key(compound, key):
+    assert COMPOUND_KEYS[compound_code(compound)] == key